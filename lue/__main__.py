@@ -20,6 +20,9 @@ from .reader import Lue
 from . import config, progress_manager, input_handler
 from .tts_manager import TTSManager, get_default_tts_model_name
 
+# Directory holding the bundled key presets and guide, resolved once at import
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def get_keyboard_shortcuts_file(keys_arg):
     """Resolve the keyboard shortcuts file path from the command line argument."""
     # If it's a direct file path that exists, use it
@@ -27,18 +30,18 @@ def get_keyboard_shortcuts_file(keys_arg):
         return keys_arg
     
     # If it's a preset name, look for keys_{name}.json in the lue directory
-    preset_file = os.path.join(os.path.dirname(__file__), f'keys_{keys_arg}.json')
+    preset_file = os.path.join(PACKAGE_DIR, f'keys_{keys_arg}.json')
     if os.path.isfile(preset_file):
         return preset_file
     
     # If it's the special "default" name, use keys_default.json
     if keys_arg == "default":
-        default_file = os.path.join(os.path.dirname(__file__), 'keys_default.json')
+        default_file = os.path.join(PACKAGE_DIR, 'keys_default.json')
         if os.path.isfile(default_file):
             return default_file
     
     # Fallback to default
-    return os.path.join(os.path.dirname(__file__), 'keys_default.json')
+    return os.path.join(PACKAGE_DIR, 'keys_default.json')
 
 def get_guide_file_path():
     """Get the path to the guide file, creating a temporary file if needed for packaged installs."""
@@ -61,7 +64,7 @@ def get_guide_file_path():
             
         except (FileNotFoundError, ModuleNotFoundError):
             # Fallback to local file (for development)
-            guide_path = os.path.join(os.path.dirname(__file__), 'guide.txt')
+            guide_path = os.path.join(PACKAGE_DIR, 'guide.txt')
             if os.path.exists(guide_path):
                 return guide_path
             else:
@@ -307,7 +310,7 @@ async def main():
         lang = args.lang if hasattr(args, 'lang') else None
         tts_instance = tts_manager.create_model(args.tts, console, voice=voice, lang=lang)
 
-    reader = Lue(args.file_path, tts_model=tts_instance, overlap=args.over)
+    reader = Lue(args.file_path, tts_model=tts_instance, overlap=args.over, console=console)
     if hasattr(args, 'speed'):
         reader.playback_speed = args.speed
         
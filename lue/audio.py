@@ -9,10 +9,24 @@ from . import config, content_parser
 ABBREVIATION_PATTERN = r'\b(Mr|Mrs|Ms|Dr|Prof|Rev|Hon|Jr|Sr|Cpl|Sgt|Gen|Col|Capt|Lt|Pvt|vs|viz|Co|Inc|Ltd|Corp|St|Ave|Blvd)\.'
 INITIAL_PATTERN = r'\b([A-Z])\.(?=\s[A-Z])'
 
+# Compiled once since clean_tts_text() runs for every sentence sent to the TTS engine
+_ABBREVIATION_RE = re.compile(ABBREVIATION_PATTERN)
+_INITIAL_RE = re.compile(INITIAL_PATTERN)
+_LOOSE_PUNCTUATION_RE = re.compile(r'(?:^|\s)[.,:;!?]+(?=\s|$)')
+_DASH_BEFORE_QUOTE_RE = re.compile(r'(?:^|\s)-(?=")')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Number of synthesized sentences kept in memory for reuse when playback restarts
+SYNTHESIS_CACHE_SIZE = 32
+
+# Last probed duration per audio file path, stored with the file's identity at probe time
+_DURATION_CACHE = {}
+
 
 # Word mapping functionality moved to timing_calculator.py
 # Import it here for backward compatibility
 from .timing_calculator import create_word_mapping as _create_word_mapping
+from .timing_calculator import process_tts_timing_data
 
 
 def clean_tts_text(text: str) -> str:
@@ -22,22 +36,33 @@ def clean_tts_text(text: str) -> str:
     marks that are not connected to any word.
     """
     # Remove periods from abbreviations and initials
-    text = re.sub(ABBREVIATION_PATTERN, r'\1', text)
-    text = re.sub(INITIAL_PATTERN, r'\1 ', text)
+    text = _ABBREVIATION_RE.sub(r'\1', text)
+    text = _INITIAL_RE.sub(r'\1 ', text)
     
     # Remove loose punctuation marks that are standalone (not connected to words)
     # This pattern matches punctuation that is surrounded by whitespace or at string boundaries
-    text = re.sub(r'(?:^|\s)[.,:;!?]+(?=\s|$)', ' ', text)
+    text = _LOOSE_PUNCTUATION_RE.sub(' ', text)
     
     # Remove standalone dashes that are followed by quotation marks
     # This prevents TTS engines from reading "-" as "dash" in cases like: -" 
-    text = re.sub(r'(?:^|\s)-(?=")', ' ', text)
+    text = _DASH_BEFORE_QUOTE_RE.sub(' ', text)
     
     # Clean up any extra whitespace that might result from removing punctuation
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     
     return text
 
+async def _terminate_process(process):
+    """Terminate a playback process, killing it if it does not exit promptly."""
+    try:
+        if process.returncode is None:
+            process.terminate()
+            try: await asyncio.wait_for(process.wait(), timeout=0.2)
+            except asyncio.TimeoutError:
+                process.kill()
+                await asyncio.wait_for(process.wait(), timeout=0.1)
+    except (ProcessLookupError, AttributeError, asyncio.TimeoutError): pass
+
 async def stop_and_clear_audio(reader):
     """Stop audio playback and clear the audio queue."""
     tasks_to_cancel = []
@@ -53,15 +78,9 @@ async def stop_and_clear_audio(reader):
     
     processes_to_kill = reader.playback_processes.copy()
     reader.playback_processes.clear()
-    for process in processes_to_kill:
-        try:
-            if process.returncode is None:
-                process.terminate()
-                try: await asyncio.wait_for(process.wait(), timeout=0.2)
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await asyncio.wait_for(process.wait(), timeout=0.1)
-        except (ProcessLookupError, AttributeError, asyncio.TimeoutError): pass
+    if processes_to_kill:
+        # Stop all players at once so their termination timeouts overlap instead of adding up
+        await asyncio.gather(*(_terminate_process(process) for process in processes_to_kill))
     
     try:
         pkill_proc = await asyncio.create_subprocess_exec('pkill', '-9', '-f', 'ffplay.*buffer_', stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -82,8 +101,9 @@ async def stop_and_clear_audio(reader):
             buf = f"{buf_base}{ext}"
             for attempt in range(5):  # Increased attempts
                 try:
-                    if os.path.exists(buf): 
-                        os.remove(buf)
+                    os.remove(buf)
+                    break
+                except FileNotFoundError:
                     break
                 except OSError:
                     if attempt < 4: 
@@ -97,6 +117,35 @@ async def stop_and_clear_audio(reader):
         
 async def get_audio_duration(file_path):
     """Get the duration of an audio file."""
+    # The timing calculation and the producer both ask for the duration of each new file,
+    # only the first request runs ffprobe as long as the file is unchanged
+    file_key = _get_file_key(file_path)
+    if file_key is not None:
+        cached = _DURATION_CACHE.get(file_path)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+    duration = await _probe_audio_duration(file_path)
+    if file_key is not None:
+        _DURATION_CACHE[file_path] = (file_key, duration)
+    return duration
+
+def cache_audio_duration(file_path, duration):
+    """Record the known duration of an audio file so get_audio_duration() does not probe it."""
+    file_key = _get_file_key(file_path)
+    if file_key is not None:
+        _DURATION_CACHE[file_path] = (file_key, duration)
+
+def _get_file_key(file_path):
+    """Identify the current contents of a file by inode, size and modification time."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+async def _probe_audio_duration(file_path):
+    """Run ffprobe to read the duration of an audio file."""
     command = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', file_path]
     process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE, stderr=subprocess.DEVNULL)
     stdout, _ = await process.communicate()
@@ -173,7 +222,9 @@ async def _producer_loop(reader):
                 
                 for attempt in range(3):
                     try:
-                        if os.path.exists(output_filename): os.remove(output_filename)
+                        os.remove(output_filename)
+                        break
+                    except FileNotFoundError:
                         break
                     except OSError:
                         if attempt < 2: await asyncio.sleep(0.05)
@@ -181,31 +232,47 @@ async def _producer_loop(reader):
                 # Create sanitized version for TTS
                 sanitized_text = content_parser.sanitize_text_for_tts(original_text)
                 
-                timing_info = None
-                
-                # Use the timing-aware method if available
-                if hasattr(reader.tts_model, 'generate_audio_with_timing'):
-                    try:
-                        timing_info = await reader.tts_model.generate_audio_with_timing(sanitized_text, output_filename)
-                    except Exception as e:
-                        # If timing generation fails, fall back to generating without it
-                        logging.error(f"TTS timing generation failed for text '{original_text[:50]}...' (sanitized: '{sanitized_text[:50]}...'): {e}")
-                        await reader.tts_model.generate_audio(sanitized_text, output_filename)
+                # Restarting playback (pause, seek, speed change) often asks for sentences that were
+                # just generated, replay those from memory instead of synthesizing them again
+                cache_key = (reader.tts_model.name, reader.tts_model.voice, sanitized_text, original_text)
+                cached = reader._synthesis_cache.get(cache_key)
+                if cached is not None:
+                    reader._synthesis_cache.move_to_end(cache_key)
+                    audio_data, duration, timing_info = cached
+                    with open(output_filename, 'wb') as f:
+                        f.write(audio_data)
+                    cache_audio_duration(output_filename, duration)
                 else:
-                    # Fallback to regular method
-                    await reader.tts_model.generate_audio(sanitized_text, output_filename)
+                    timing_info = None
+                    
+                    # Use the timing-aware method if available
+                    if hasattr(reader.tts_model, 'generate_audio_with_timing'):
+                        try:
+                            timing_info = await reader.tts_model.generate_audio_with_timing(sanitized_text, output_filename)
+                        except Exception as e:
+                            # If timing generation fails, fall back to generating without it
+                            logging.error(f"TTS timing generation failed for text '{original_text[:50]}...' (sanitized: '{sanitized_text[:50]}...'): {e}")
+                            await reader.tts_model.generate_audio(sanitized_text, output_filename)
+                    else:
+                        # Fallback to regular method
+                        await reader.tts_model.generate_audio(sanitized_text, output_filename)
 
-                # Always get the actual duration from the file
-                duration = await get_audio_duration(output_filename)
+                    # Always get the actual duration from the file
+                    duration = await get_audio_duration(output_filename)
                 
                 if not reader.running: break
                 
                 # If no timing info was generated, create a fallback structure
                 # Pass original_text to timing calculator for proper word mapping
                 if timing_info is None:
-                    from .timing_calculator import process_tts_timing_data
                     timing_info = process_tts_timing_data(original_text, [], duration)
                 
+                if cached is None and duration is not None and duration > 0:
+                    with open(output_filename, 'rb') as f:
+                        reader._synthesis_cache[cache_key] = (f.read(), duration, timing_info)
+                    if len(reader._synthesis_cache) > SYNTHESIS_CACHE_SIZE:
+                        reader._synthesis_cache.popitem(last=False)
+                
                 await asyncio.wait_for(reader.audio_queue.put((output_filename, *producer_pos, duration, timing_info)), timeout=1.0)
                 
                 next_pos = reader._advance_position(producer_pos, wrap=False)
@@ -313,7 +380,9 @@ async def _player_loop(reader):
                         except ValueError: pass
                         for attempt in range(3):
                             try:
-                                if os.path.exists(file): os.remove(file)
+                                os.remove(file)
+                                break
+                            except FileNotFoundError:
                                 break
                             except OSError:
                                 if attempt < 2: await asyncio.sleep(0.05)
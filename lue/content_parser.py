@@ -6,20 +6,28 @@ import fitz
 import markdown
 from docx import Document
 from striprtf.striprtf import rtf_to_text
-import subprocess
-import string
-from rich.console import Console
-from typing import List, Tuple
-from pathlib import Path
+from typing import Tuple
+from functools import lru_cache
 from html.parser import HTMLParser
 from html import unescape
 from urllib.parse import unquote
 
 
+# Number of distinct paragraphs whose sentence splits are kept in memory
+SENTENCE_CACHE_SIZE = 4096
+
+
 def split_into_sentences(paragraph: str) -> list[str]:
     """
     Splits a paragraph into sentences, intelligently handling common abbreviations and initials.
     """
+    # The same paragraphs are split over and over during playback, so the splits are memoized
+    return list(_split_into_sentences(paragraph))
+
+
+@lru_cache(maxsize=SENTENCE_CACHE_SIZE)
+def _split_into_sentences(paragraph: str) -> Tuple[str, ...]:
+    """Split a paragraph into an immutable tuple of sentences."""
     # A list of common English abbreviations that can be followed by a period.
     abbreviations = [
         "Mr", "Mrs", "Ms", "Dr", "Prof", "Rev", "Hon", "Jr", "Sr",
@@ -68,7 +76,7 @@ def split_into_sentences(paragraph: str) -> list[str]:
                 restored_sentences.append(restored)
                 
     # If splitting resulted in an empty list, return the original paragraph as a single sentence.
-    return restored_sentences if restored_sentences else [paragraph]
+    return tuple(restored_sentences) if restored_sentences else (paragraph,)
 
 
 def sanitize_text_for_tts(text):
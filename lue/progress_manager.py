@@ -90,8 +90,10 @@ def save_progress(progress_file, chapter_idx, paragraph_idx, sentence_idx):
         sentence_idx: Current sentence index
     """
     progress = {"c": chapter_idx, "p": paragraph_idx, "s": sentence_idx}
+    # Serialize first so the file is written in one call rather than chunk by chunk
+    data = json.dumps(progress, indent=2)
     with open(progress_file, 'w', encoding='utf-8') as f:
-        json.dump(progress, f, indent=2)
+        f.write(data)
 
 def save_extended_progress(progress_file, chapter_idx, paragraph_idx, sentence_idx, 
                           scroll_offset, tts_enabled, auto_scroll_enabled, manual_scroll_anchor=None, original_file_path=None, playback_speed=1.0, percentage=0.0, speed_reading_enabled=False):
@@ -133,8 +135,10 @@ def save_extended_progress(progress_file, chapter_idx, paragraph_idx, sentence_i
     # For now, we'll just add it if passed in kwargs or update the signature.
     # Actually, I should update the signature in the same edit.
         
+    # Serialize first so the file is written in one call rather than chunk by chunk
+    data = json.dumps(progress, indent=2)
     with open(progress_file, 'w', encoding='utf-8') as f:
-        json.dump(progress, f, indent=2)
+        f.write(data)
 
 def get_recent_books(limit=5):
     """
@@ -203,8 +207,10 @@ def validate_and_set_progress(chapters, progress_file, c, p, s):
         return c, p, s
     except IndexError:
         # Invalid progress, reset to beginning
-        if os.path.exists(progress_file):
+        try:
             os.remove(progress_file)
+        except FileNotFoundError:
+            pass
         return 0, 0, 0
 
 def find_most_recent_book():
@@ -1,10 +1,14 @@
 import os
 import sys
 import asyncio
+import bisect
 import re
 import signal
 import logging
+import operator
 import subprocess
+from array import array
+from collections import OrderedDict
 from rich.console import Console
 from rich.text import Text
 import platformdirs
@@ -12,9 +16,13 @@ import platformdirs
 from . import config, content_parser, progress_manager, audio, ui, input_handler
 from .tts.base import TTSBase
 
+_HIGHLIGHTABLE_CHAR = re.compile(r'[a-zA-Z0-9]')
+_REPEATED_SPACES = re.compile(r' {2,}')
+
 class Lue:
-    def __init__(self, file_path, tts_model: TTSBase | None, overlap: float | None = None):
-        self.console = Console()
+    def __init__(self, file_path, tts_model: TTSBase | None, overlap: float | None = None, console: Console | None = None):
+        # Reuse the caller's console when given, creating one probes the terminal again
+        self.console = console if console is not None else Console()
         self.loop = None
         self.file_path = file_path
         self.book_title = os.path.splitext(os.path.basename(file_path))[0]
@@ -40,6 +48,8 @@ class Lue:
         self.playback_finished_event = asyncio.Event()
         self.audio_queue = asyncio.Queue(maxsize=config.MAX_QUEUE_SIZE)
         self.active_playback_tasks = []
+        # Recently synthesized sentences, reused when playback restarts on text it already generated
+        self._synthesis_cache = OrderedDict()
         self.audio_restart_lock = asyncio.Lock()
         self.pending_restart_task = None
         self.playback_speed = 1.0  # Default speed multiplier
@@ -84,10 +94,25 @@ class Lue:
             self.console.print(f"[bold cyan]Loading TTS model...[/bold cyan]")
         
         self.document_lines = []
-        self.line_to_position = {}
+        # Chapter and paragraph of each document line, -1 for separator lines
+        self.line_chap = array('i')
+        self.line_para = array('i')
+        self.line_plain_lens = array('i')
         self.position_to_line = {}
+        # First line of each sentence in document order, for viewport lookups
+        self.sentence_lines = array('i')
+        self.sentence_positions = []
         self.paragraph_line_ranges = {}
         
+        # Layout caches, only valid for the currently loaded chapters
+        self._wrap_cache = OrderedDict()
+        self._sentence_cache = {}
+        self._last_layout_width = None
+        self._highlight_cache = None
+        self._highlight_lines_cache = None
+        self._themed_lines = {}
+        self._themed_lines_version = None
+        
         self.total_sentences = sum(
             len(content_parser.split_into_sentences(paragraph)) 
             for chapter in self.chapters 
@@ -234,6 +259,8 @@ class Lue:
         self.selection_end = None
         self.selection_start_pos = None
         self.selection_end_pos = None
+        self._selection_span_table = {}
+        self._selection_span_key = None
         self.mouse_pressed = False
         self.mouse_press_pos = None
         
@@ -241,11 +268,16 @@ class Lue:
         self.last_rendered_state = None
         self.last_terminal_size = None
         self.render_lock = asyncio.Lock()
+        self._render_console = Console(force_terminal=True)
+        self._render_console_size = None
+        self._last_output_lines = None
+        self._last_output_key = None
         self._layout_needs_update = self.speed_reading_enabled
         self.resize_scheduled = False
         self.first_sentence_jump = False
         self._initial_load_complete = True
         self.subtitle_hitboxes = []
+        self._subtitle_cache = {}
 
     async def initialize_tts(self) -> bool:
         """Initializes the selected TTS model."""
@@ -386,8 +418,8 @@ class Lue:
         if not (0 <= content_y < available_height): return None
         clicked_line = int(self.scroll_offset) + content_y
         if clicked_line >= len(self.document_lines): return None
-        if clicked_line in self.line_to_position:
-            chap_idx, para_idx, _ = self.line_to_position[clicked_line]
+        if self.line_chap[clicked_line] >= 0:
+            chap_idx, para_idx = self.line_chap[clicked_line], self.line_para[clicked_line]
             if (chap_idx, para_idx) in self.paragraph_line_ranges:
                 para_start, _ = self.paragraph_line_ranges[(chap_idx, para_idx)]
                 paragraph = self.chapters[chap_idx][para_idx]
@@ -400,7 +432,8 @@ class Lue:
                 wrapped_lines = Text(paragraph, justify="left", no_wrap=False).wrap(self.console, max(20, width - 10))
                 line_offset = clicked_line - para_start
                 if 0 <= line_offset < len(wrapped_lines):
-                    char_pos_in_para = sum(len(line.plain) for line in wrapped_lines[:line_offset]) + min(content_x, len(wrapped_lines[line_offset].plain))
+                    line_lens = [len(line.plain) for line in wrapped_lines[:line_offset + 1]]
+                    char_pos_in_para = sum(line_lens[:-1]) + min(content_x, line_lens[-1])
                     for start_char, end_char, sent_idx in sentence_positions:
                         if start_char <= char_pos_in_para <= end_char:
                             return (chap_idx, para_idx, sent_idx)
@@ -420,8 +453,7 @@ class Lue:
             
         # Clamp content_x to the actual line length
         if clicked_line < len(self.document_lines):
-            line_text = self.document_lines[clicked_line].plain
-            content_x = min(content_x, len(line_text))
+            content_x = min(content_x, self.line_plain_lens[clicked_line])
         
         return (clicked_line, content_x)
 
@@ -630,13 +662,13 @@ class Lue:
         
         # Clean up the text: replace multiple spaces with single spaces
         # This handles cases like "  ", "   ", "    ", etc.
-        cleaned_text = re.sub(r' {2,}', ' ', raw_text)
+        cleaned_text = _REPEATED_SPACES.sub(' ', raw_text)
         
         # Remove any remaining newlines (just in case)
         cleaned_text = cleaned_text.replace('\n', ' ')
         
         # Clean up any double spaces that might have been created
-        cleaned_text = re.sub(r' {2,}', ' ', cleaned_text)
+        cleaned_text = _REPEATED_SPACES.sub(' ', cleaned_text)
         
         # Strip leading/trailing whitespace
         return cleaned_text.strip()
@@ -792,25 +824,24 @@ class Lue:
         """Finds and returns the (c, p, s) of the topmost sentence in the viewport."""
         top_visible_line = int(self.scroll_offset)
         bottom_visible_line = top_visible_line + max(1, ui.get_terminal_size()[1] - 4)
-        topmost_sentence_pos = None
-        earliest_line = float('inf')
-
-        for pos, line_num in self.position_to_line.items():
-            if top_visible_line <= line_num < bottom_visible_line:
-                if line_num < earliest_line:
-                    earliest_line = line_num
-                    topmost_sentence_pos = pos
-        
+        topmost_sentence_pos = self._get_first_sentence_in_lines(top_visible_line, bottom_visible_line)
         if topmost_sentence_pos:
             return topmost_sentence_pos
 
-        last_pos_before_view = None
-        latest_line = -1
-        for pos, line_num in self.position_to_line.items():
-            if line_num < top_visible_line and line_num > latest_line:
-                latest_line = line_num
-                last_pos_before_view = pos
-        return last_pos_before_view
+        # Otherwise use the first sentence starting on the last line above the view
+        idx = bisect.bisect_left(self.sentence_lines, top_visible_line)
+        if idx == 0:
+            return None
+        idx = bisect.bisect_left(self.sentence_lines, self.sentence_lines[idx - 1])
+        return self.sentence_positions[idx]
+
+    def _get_first_sentence_in_lines(self, start_line, end_line):
+        """Returns the (c, p, s) of the first sentence starting in [start_line, end_line), if any."""
+        # Sentence start lines are in document order, so the viewport can be found by bisection
+        idx = bisect.bisect_left(self.sentence_lines, start_line)
+        if idx < len(self.sentence_lines) and self.sentence_lines[idx] < end_line:
+            return self.sentence_positions[idx]
+        return None
     
     def _calculate_progress_percentage(self):
         if self.total_sentences == 0: return 100.0
@@ -975,10 +1006,7 @@ class Lue:
 
     def _handle_move_to_top_immediate(self):
         top_visible_line, bottom_visible_line = int(self.scroll_offset), int(self.scroll_offset) + max(1, ui.get_terminal_size()[1] - 4)
-        topmost_sentence, topmost_line = None, float('inf')
-        for pos, line in self.position_to_line.items():
-            if top_visible_line <= line < bottom_visible_line and line < topmost_line:
-                topmost_line, topmost_sentence = line, pos
+        topmost_sentence = self._get_first_sentence_in_lines(top_visible_line, bottom_visible_line)
         if topmost_sentence:
             self.chapter_idx, self.paragraph_idx, self.sentence_idx = topmost_sentence
             self.ui_chapter_idx, self.ui_paragraph_idx, self.ui_sentence_idx = topmost_sentence
@@ -989,10 +1017,7 @@ class Lue:
 
     def _handle_move_to_top_smooth(self):
         top_visible_line, bottom_visible_line = int(self.scroll_offset), int(self.scroll_offset) + max(1, ui.get_terminal_size()[1] - 4)
-        topmost_sentence, topmost_line = None, float('inf')
-        for pos, line in self.position_to_line.items():
-            if top_visible_line <= line < bottom_visible_line and line < topmost_line:
-                topmost_line, topmost_sentence = line, pos
+        topmost_sentence = self._get_first_sentence_in_lines(top_visible_line, bottom_visible_line)
         if topmost_sentence:
             self.chapter_idx, self.paragraph_idx, self.sentence_idx = topmost_sentence
             self.ui_chapter_idx, self.ui_paragraph_idx, self.ui_sentence_idx = topmost_sentence
@@ -1071,6 +1096,7 @@ class Lue:
                 await audio.play_from_current_position(self)
 
     def _handle_resize(self, signum, frame):
+        ui.invalidate_terminal_size()
         if not self.resize_scheduled:
             # In manual mode, create a simple anchor based on the top visible sentence
             if not self.auto_scroll_enabled:
@@ -1118,10 +1144,59 @@ class Lue:
                 logging.error(f"Error in UI update loop: {e}", exc_info=True)
                 await asyncio.sleep(self.ui_update_interval)
 
+    def _index_word_timings(self):
+        """Precompute the lookup data the word update loop needs for the current word timings."""
+        self.current_word_starts = None
+        self.current_word_timings_end = None
+        
+        # Original words grouped by the TTS word they map to
+        self.current_word_groups = {}
+        for orig_idx, mapped_tts_idx in enumerate(self.current_word_mapping or []):
+            self.current_word_groups.setdefault(mapped_tts_idx, []).append(orig_idx)
+        
+        if not self.current_word_timings:
+            return
+        try:
+            # Start times are kept as a flat array of doubles next to the (word, start, end) tuples
+            starts = array('d', [start for _, start, _ in self.current_word_timings])
+            self.current_word_timings_end = max(end for _, _, end in self.current_word_timings)
+        except TypeError:
+            # Incomplete timings, the word update loop falls back to scanning them
+            return
+        # Word lookups can only bisect if the timings are in order
+        # Compare each start with the next one without a Python-level loop
+        if all(map(operator.le, starts, starts[1:])):
+            self.current_word_starts = starts
+
+    def _find_word_timing_index(self, elapsed):
+        """Returns the index of the word timing that contains elapsed, or None."""
+        starts = self.current_word_starts
+        if starts is not None:
+            idx = bisect.bisect_right(starts, elapsed) - 1
+            if idx >= 0 and elapsed < self.current_word_timings[idx][2]:
+                return idx
+            return None
+        for i, (word, start_time, end_time) in enumerate(self.current_word_timings):
+            if elapsed >= start_time and elapsed < end_time:
+                return i
+        return None
+
+    def _time_until_next_word(self, elapsed):
+        """Returns the sentence time left until the next word timing starts, or None."""
+        starts = self.current_word_starts
+        if starts is None:
+            return None
+        idx = bisect.bisect_right(starts, elapsed)
+        if idx < len(starts):
+            return starts[idx] - elapsed
+        return None
+
     async def _word_update_loop(self):
         """Update word index during playback based on elapsed time."""
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
+                delay = 0.05  # Update at 20Hz
                 if (not self.is_paused and
                     hasattr(self, 'current_sentence_words') and
                     hasattr(self, 'current_sentence_duration') and
@@ -1129,7 +1204,7 @@ class Lue:
                     self.current_sentence_words and
                     self.current_sentence_duration > 0):
 
-                    elapsed = asyncio.get_event_loop().time() - self.current_word_start_time
+                    elapsed = loop.time() - self.current_word_start_time
                     # Account for playback speed
                     adjusted_elapsed = elapsed * self.playback_speed
 
@@ -1140,22 +1215,23 @@ class Lue:
                         
                         # Use precise word timings if available
                         if hasattr(self, 'current_word_timings') and self.current_word_timings:
+                            # Wake up right at the next word boundary rather than up to a tick late
+                            until_next_word = self._time_until_next_word(adjusted_elapsed)
+                            if until_next_word is not None and self.playback_speed > 0:
+                                delay = min(delay, max(0.0, until_next_word / self.playback_speed))
+
                             # Use word mapping if available to handle TTS word boundary mismatches
                             if hasattr(self, 'current_word_mapping') and self.current_word_mapping:
                                 # Find which TTS word should be highlighted based on timing
-                                tts_word_idx = None
                                 tts_word_start = None
                                 tts_word_end = None
-                                for i, (word, start_time, end_time) in enumerate(self.current_word_timings):
-                                    if adjusted_elapsed >= start_time and adjusted_elapsed < end_time:
-                                        tts_word_idx = i
-                                        tts_word_start = start_time
-                                        tts_word_end = end_time
-                                        break
+                                tts_word_idx = self._find_word_timing_index(adjusted_elapsed)
+                                if tts_word_idx is not None:
+                                    _, tts_word_start, tts_word_end = self.current_word_timings[tts_word_idx]
                                 
                                 # If we've passed all TTS words, use the last one
-                                if tts_word_idx is None and self.current_word_timings:
-                                    sentence_duration = max([end for _, _, end in self.current_word_timings])
+                                elif self.current_word_timings:
+                                    sentence_duration = self.current_word_timings_end
                                     if adjusted_elapsed >= sentence_duration:
                                         tts_word_idx = len(self.current_word_timings) - 1
                                         _, tts_word_start, tts_word_end = self.current_word_timings[tts_word_idx]
@@ -1163,10 +1239,7 @@ class Lue:
                                 # Map TTS word index back to original word index with sub-word timing
                                 if tts_word_idx is not None:
                                     # Find all original words that map to this TTS word
-                                    mapped_orig_words = []
-                                    for orig_idx, mapped_tts_idx in enumerate(self.current_word_mapping):
-                                        if mapped_tts_idx == tts_word_idx:
-                                            mapped_orig_words.append(orig_idx)
+                                    mapped_orig_words = self.current_word_groups.get(tts_word_idx)
                                     
                                     if mapped_orig_words:
                                         if len(mapped_orig_words) == 1:
@@ -1187,28 +1260,26 @@ class Lue:
                                         current_word_idx = min(tts_word_idx, total_words - 1)
                             else:
                                 # Original logic for direct TTS word timing
-                                for i, (word, start_time, end_time) in enumerate(self.current_word_timings):
-                                    # Check if current time falls within this word's timing
-                                    if adjusted_elapsed >= start_time and adjusted_elapsed < end_time:
-                                        current_word_idx = min(i, total_words - 1)
-                                        break
+                                tts_word_idx = self._find_word_timing_index(adjusted_elapsed)
+                                if tts_word_idx is not None:
+                                    current_word_idx = min(tts_word_idx, total_words - 1)
                                 # If we've passed all words, highlight the last one
                                 else:
                                     if self.current_word_timings:
                                         # Only highlight the last word if we've actually finished the sentence
-                                        sentence_duration = max([end for _, _, end in self.current_word_timings])
+                                        sentence_duration = self.current_word_timings_end
                                         if adjusted_elapsed >= sentence_duration:
                                             current_word_idx = total_words - 1
                         else:
-                            # Estimate time per word (simple equal distribution)
-                            time_per_word = self.current_sentence_duration / total_words
-                            current_word_idx = min(int(adjusted_elapsed / time_per_word), total_words - 1)
+                            # Estimate the word by simple equal distribution, using the
+                            # words per second worked out when the sentence started
+                            current_word_idx = min(int(adjusted_elapsed * self.current_words_per_second), total_words - 1)
 
                         # Update word index if it changed
                         if current_word_idx != self.ui_word_idx:
                             self.ui_word_idx = current_word_idx
 
-                await asyncio.sleep(0.05)  # Update at 20Hz
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 break
             except Exception:
@@ -1252,11 +1323,12 @@ class Lue:
                     error_lines = [line.strip() for line in session_lines if " - ERROR - " in line]
                     
                     if error_lines:
-                        error_console = Console()
-                        error_console.print("\n[bold red]Errors recorded during this session:[/bold red]")
+                        # Print the whole report at once instead of one write per error
+                        report = ["\n[bold red]Errors recorded during this session:[/bold red]"]
                         for error in error_lines:
                             message = ' - '.join(error.split(' - ')[3:])
-                            error_console.print(f"- {message}")
+                            report.append(f"- {message}")
+                        self.console.print("\n".join(report))
                     
                     # Clear the log file after displaying errors
                     os.remove(log_file)
@@ -1435,8 +1507,13 @@ class Lue:
                     current_text = sentences[s]
                     # Use improved word filtering that excludes punctuation-only tokens
                     # but still preserves all text visually
-                    self.current_sentence_words = [token for token in current_text.split() if re.search(r'[a-zA-Z0-9]', token)]
+                    self.current_sentence_words = [token for token in current_text.split() if _HIGHLIGHTABLE_CHAR.search(token)]
                     self.current_sentence_duration = timing_info.get("speech_duration") or duration
+                    # Words per second for the estimated highlight, so each tick is a single multiply
+                    self.current_words_per_second = (
+                        len(self.current_sentence_words) / self.current_sentence_duration
+                        if self.current_sentence_duration else 0.0
+                    )
                     self.current_word_start_time = asyncio.get_event_loop().time()
                     
                     word_timings = timing_info.get("word_timings", [])
@@ -1446,6 +1523,7 @@ class Lue:
                     else:
                         self.current_word_timings = None
                         self.current_word_mapping = None
+                    self._index_word_timings()
                 elif command_name == 'click_jump':
                     if clicked_position := self._find_sentence_at_click(*data):
                         self.first_sentence_jump = False
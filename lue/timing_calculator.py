@@ -7,6 +7,8 @@ import re
 import string
 from typing import List, Tuple, Optional, Dict, Any
 
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
+
 def _sanitize_word(word: str) -> str:
     """
     Sanitize a word by stripping all non-alphanumeric characters and converting to lowercase.
@@ -24,7 +26,7 @@ def _sanitize_word(word: str) -> str:
         return ""
     
     # Strip all non-alphanumeric characters
-    sanitized = re.sub(r'[^a-zA-Z0-9]', '', word)
+    sanitized = _NON_ALPHANUMERIC.sub('', word)
     
     # Convert to lowercase for case-insensitive comparison
     return sanitized.lower()
@@ -124,36 +126,35 @@ def create_word_mapping(original_words: List[str], tts_word_timings: List[Tuple[
     if len(original_words) == len(tts_words):
         # Check if sanitized versions match
         if orig_sanitized == tts_sanitized:
-            logging.debug(f"create_word_mapping: Perfect 1:1 match with {len(original_words)} words")
+            logging.debug("create_word_mapping: Perfect 1:1 match with %d words", len(original_words))
             return list(range(len(original_words)))
     
     # Create enhanced mapping algorithm with fuzzy matching
     mapping = []
     tts_index = 0
     
-    logging.debug(f"create_word_mapping: Mapping {len(original_words)} original words to {len(tts_words)} TTS words")
+    logging.debug("create_word_mapping: Mapping %d original words to %d TTS words", len(original_words), len(tts_words))
     
-    for orig_index, orig_word in enumerate(original_words):
+    # Walk each original word together with its sanitized form
+    for orig_index, (orig_word, orig_sanitized_word) in enumerate(zip(original_words, orig_sanitized)):
         # Handle edge case: exhausted TTS words
         if tts_index >= len(tts_words):
             # Map remaining original words to the last TTS word
             last_tts_index = max(0, len(tts_words) - 1)
             mapping.append(last_tts_index)
-            logging.debug(f"create_word_mapping: Word {orig_index} '{orig_word}' -> TTS {last_tts_index} (exhausted TTS words)")
+            logging.debug("create_word_mapping: Word %d '%s' -> TTS %d (exhausted TTS words)", orig_index, orig_word, last_tts_index)
             continue
         
-        orig_sanitized_word = orig_sanitized[orig_index]
-        
         # Handle punctuation-only tokens by mapping to previous word
         if not orig_sanitized_word:
             # Map punctuation to the previous word's timing, or first TTS word if this is the first original word
             if mapping:
                 prev_mapping = mapping[-1]
                 mapping.append(prev_mapping)
-                logging.debug(f"create_word_mapping: Word {orig_index} '{orig_word}' (punctuation-only) -> TTS {prev_mapping} (previous)")
+                logging.debug("create_word_mapping: Word %d '%s' (punctuation-only) -> TTS %d (previous)", orig_index, orig_word, prev_mapping)
             else:
                 mapping.append(0)
-                logging.debug(f"create_word_mapping: Word {orig_index} '{orig_word}' (punctuation-only) -> TTS 0 (first)")
+                logging.debug("create_word_mapping: Word %d '%s' (punctuation-only) -> TTS 0 (first)", orig_index, orig_word)
             continue
         
         # Find the best matching TTS word using fuzzy matching with scoring
@@ -199,12 +200,12 @@ def create_word_mapping(original_words: List[str], tts_word_timings: List[Tuple[
         if best_match_index is None or best_match_score == 0:
             # No good match found, use current TTS index as fallback
             mapping.append(tts_index)
-            logging.debug(f"create_word_mapping: Word {orig_index} '{orig_word}' -> TTS {tts_index} (no match, fallback)")
+            logging.debug("create_word_mapping: Word %d '%s' -> TTS %d (no match, fallback)", orig_index, orig_word, tts_index)
             tts_index += 1
         else:
             # Found a match, use it
             mapping.append(best_match_index)
-            logging.debug(f"create_word_mapping: Word {orig_index} '{orig_word}' -> TTS {best_match_index} '{tts_words[best_match_index]}' (score={best_match_score})")
+            logging.debug("create_word_mapping: Word %d '%s' -> TTS %d '%s' (score=%s)", orig_index, orig_word, best_match_index, tts_words[best_match_index], best_match_score)
             
             # Advance tts_index if we found a good match and it's not too far ahead
             # This prevents skipping too many TTS words at once
@@ -213,7 +214,7 @@ def create_word_mapping(original_words: List[str], tts_word_timings: List[Tuple[
     
     # Handle edge case: mismatched counts - log warning
     if len(original_words) != len(tts_words):
-        logging.debug(f"create_word_mapping: Word count mismatch - {len(original_words)} original vs {len(tts_words)} TTS")
+        logging.debug("create_word_mapping: Word count mismatch - %d original vs %d TTS", len(original_words), len(tts_words))
     
     return mapping
 
@@ -282,37 +283,25 @@ def adjust_word_timings_for_continuity(word_timings: List[Tuple[str, float, floa
             
         cleaned_timings.append((word, start_time, end_time))
     
-    # Second pass: ensure continuity
-    for i in range(len(cleaned_timings)):
-        word, start_time, end_time = cleaned_timings[i]
-        
-        # Skip entries with None values
-        if start_time is None or end_time is None:
-            adjusted_word_timings.append((word, start_time, end_time))
-            continue
-        
-        # For all words except the last one, adjust end time for continuity
-        if i < len(cleaned_timings) - 1:
-            next_word, next_start_time, next_end_time = cleaned_timings[i + 1]
-            
-            # Only adjust if next start time is valid
-            if next_start_time is not None:
-                # If there's a gap, extend current word to fill it
-                if next_start_time > end_time:
-                    adjusted_end_time = next_start_time
-                # If there's overlap, split the difference
-                elif next_start_time < end_time:
-                    adjusted_end_time = (end_time + next_start_time) / 2
-                else:
-                    adjusted_end_time = end_time
-            else:
-                adjusted_end_time = end_time
+    # Second pass: ensure continuity by pairing each word with the next one
+    for (word, start_time, end_time), (_, next_start_time, _) in zip(cleaned_timings, cleaned_timings[1:]):
+        # Only adjust if both this word and the next start time are valid
+        if start_time is None or end_time is None or next_start_time is None:
+            adjusted_end_time = end_time
+        # If there's a gap, extend current word to fill it
+        elif next_start_time > end_time:
+            adjusted_end_time = next_start_time
+        # If there's overlap, split the difference
+        elif next_start_time < end_time:
+            adjusted_end_time = (end_time + next_start_time) / 2
         else:
-            # For the last word, keep the original end time
             adjusted_end_time = end_time
             
         adjusted_word_timings.append((word, start_time, adjusted_end_time))
     
+    # For the last word, keep the original end time
+    adjusted_word_timings.append(cleaned_timings[-1])
+    
     return adjusted_word_timings
 
 
@@ -329,7 +318,7 @@ def calculate_speech_duration(word_timings: List[Tuple[str, float, float]]) -> f
     if not word_timings:
         return 0.0
     
-    return max([end for _, _, end in word_timings])
+    return max(end for _, _, end in word_timings)
 
 
 def estimate_word_timings_from_duration(text: str, total_duration: float) -> List[Tuple[str, float, float]]:
@@ -345,7 +334,20 @@ def estimate_word_timings_from_duration(text: str, total_duration: float) -> Lis
         List of (word, start_time, end_time) tuples
     """
     # Use the improved word filtering function
-    words = _get_highlightable_words(text)
+    return _estimate_timings_for_words(_get_highlightable_words(text), total_duration)
+
+
+def _estimate_timings_for_words(words: List[str], total_duration: float) -> List[Tuple[str, float, float]]:
+    """
+    Spread a duration evenly over words that were already extracted from the text.
+    
+    Args:
+        words: Highlightable words of the spoken text
+        total_duration: Total duration of the audio in seconds
+        
+    Returns:
+        List of (word, start_time, end_time) tuples
+    """
     if not words:
         return []
     
@@ -354,14 +356,9 @@ def estimate_word_timings_from_duration(text: str, total_duration: float) -> Lis
         total_duration = len(words) * 0.3
     
     time_per_word = total_duration / len(words)
-    word_timings = []
-    
-    for i, word in enumerate(words):
-        start_time = i * time_per_word
-        end_time = (i + 1) * time_per_word
-        word_timings.append((word, start_time, end_time))
     
-    return word_timings
+    # Word i spans [i, i + 1) time slots, built in a single pass
+    return [(word, i * time_per_word, (i + 1) * time_per_word) for i, word in enumerate(words)]
 
 
 def process_tts_timing_data(
@@ -386,31 +383,33 @@ def process_tts_timing_data(
         - word_mapping: Mapping from original words to TTS timings
     """
     try:
+        # Extract the words once, both the estimation and the mapping work on them
+        original_words = _get_highlightable_words(original_text)
+        
         # If no raw timings provided, estimate from duration
         if not raw_word_timings:
             if total_duration is None:
                 logging.warning("No timing data and no duration provided, using fallback estimation")
                 total_duration = len(original_text.split()) * 0.3
             
-            word_timings = estimate_word_timings_from_duration(original_text, total_duration)
+            word_timings = _estimate_timings_for_words(original_words, total_duration)
             speech_duration = total_duration
         else:
             # Log raw timing data for debugging
-            logging.debug(f"Processing {len(raw_word_timings)} raw timing entries for text: '{original_text[:50]}...'")
+            logging.debug("Processing %d raw timing entries for text: '%s...'", len(raw_word_timings), original_text[:50])
             
             # Adjust raw timings for continuity
             word_timings = adjust_word_timings_for_continuity(raw_word_timings)
             speech_duration = calculate_speech_duration(word_timings)
         
         # Create word mapping using the improved word filtering
-        original_words = _get_highlightable_words(original_text)
         word_mapping = create_word_mapping(original_words, word_timings)
         
         # Log mapping information for debugging
-        if word_mapping:
-            logging.debug(f"Created word mapping: {len(original_words)} original words -> {len(word_timings)} TTS timings")
+        if word_mapping and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Created word mapping: %d original words -> %d TTS timings", len(original_words), len(word_timings))
             if len(original_words) != len(word_timings):
-                logging.debug(f"Word count mismatch - Original: {original_words}, TTS: {[w for w, _, _ in word_timings]}")
+                logging.debug("Word count mismatch - Original: %s, TTS: %s", original_words, [w for w, _, _ in word_timings])
         
         # Use provided total_duration or fall back to speech_duration
         final_total_duration = total_duration if total_duration is not None else speech_duration
@@ -428,7 +427,7 @@ def process_tts_timing_data(
         # Use the improved word filtering function
         fallback_words = _get_highlightable_words(original_text)
         fallback_duration = len(fallback_words) * 0.3
-        fallback_timings = estimate_word_timings_from_duration(original_text, fallback_duration)
+        fallback_timings = _estimate_timings_for_words(fallback_words, fallback_duration)
         
         return {
             "word_timings": fallback_timings,
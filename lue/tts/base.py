@@ -1,8 +1,42 @@
 """Abstract base class for TTS models in the Lue eBook reader."""
 
+import importlib.util
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from rich.console import Console
 
+try:
+    from .. import audio, config
+    from ..timing_calculator import process_tts_timing_data
+except ImportError:
+    # Handle case when running tests or imports from different context
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    import audio
+    import config
+    from timing_calculator import process_tts_timing_data
+
+
+@lru_cache(maxsize=None)
+def is_package_available(package: str) -> bool:
+    """
+    Check whether a top-level package can be imported, without importing it.
+    
+    The result is cached for the lifetime of the process, so repeated checks
+    for a missing backend do not search the import path again.
+    
+    Args:
+        package: Top-level package name (e.g., 'kokoro')
+        
+    Returns:
+        bool: True if the package is installed
+    """
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
 
 class TTSBase(ABC):
     """
@@ -108,27 +142,32 @@ class TTSBase(ABC):
         # Get raw timing data from the TTS implementation
         raw_timings = await self.get_raw_timing_data(text, output_path)
         
-        # Get actual audio duration
-        try:
-            from .. import audio
-        except ImportError:
-            # Handle case when running tests or imports from different context
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import audio
-        duration = await audio.get_audio_duration(output_path)
+        return await self._process_raw_timing_data(text, raw_timings, output_path)
+
+    async def _process_raw_timing_data(self, text: str, raw_timings, output_path: str, duration: float = None):
+        """
+        Turn raw engine timings into the processed timing information for a generated file.
+        
+        Shared by every generate_audio_with_timing() implementation so the duration
+        lookup and timing calculation only live in one place.
+        
+        Args:
+            text: Text that was converted to speech
+            raw_timings: List of (word, start_time, end_time) tuples from the TTS engine
+            output_path: Path to the generated audio file
+            duration: Audio duration when the engine already knows it, probed from the file otherwise
+            
+        Returns:
+            dict: Processed timing information, see generate_audio_with_timing()
+        """
+        if duration is None:
+            # Get actual audio duration
+            duration = await audio.get_audio_duration(output_path)
+        else:
+            # Let later duration lookups for this file reuse the known value
+            audio.cache_audio_duration(output_path, duration)
         
         # Process timing data using the centralized calculator
-        try:
-            from ..timing_calculator import process_tts_timing_data
-        except ImportError:
-            # Handle case when running tests or imports from different context
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import timing_calculator
-            process_tts_timing_data = timing_calculator.process_tts_timing_data
         return process_tts_timing_data(text, raw_timings, duration)
 
     async def get_raw_timing_data(self, text: str, output_path: str):
@@ -165,5 +204,4 @@ class TTSBase(ABC):
         Returns:
             float: Overlap seconds specific to this TTS model, or None to use default
         """
-        from .. import config
         return config.TTS_OVERLAP_SECONDS.get(self.name)
\ No newline at end of file
@@ -1,6 +1,6 @@
-import os
 import asyncio
 import logging
+import time
 from rich.console import Console
 
 from .base import TTSBase
@@ -52,22 +52,25 @@ class EdgeTTS(TTSBase):
             
             # Collect word timing information
             word_timings = []
-            audio_chunks = []
-            
-            async for chunk in communicate.stream():
-                if chunk['type'] == 'WordBoundary':
-                    # Convert from 100-nanosecond units to seconds
-                    start_time = chunk['offset'] / 10000000.0
-                    end_time = (chunk['offset'] + chunk['duration']) / 10000000.0
-                    word_timings.append((chunk['text'], start_time, end_time))
-                elif chunk['type'] == 'audio':
-                    audio_chunks.append(chunk['data'])
-            
-            # Save audio to file
+            started = time.monotonic()
+            first_audio_latency = None
+
+            # Write audio to the file as it arrives instead of holding every chunk in memory
             with open(output_path, 'wb') as f:
-                for chunk in audio_chunks:
-                    f.write(chunk)
-            
+                async for chunk in communicate.stream():
+                    if chunk['type'] == 'WordBoundary':
+                        # Convert from 100-nanosecond units to seconds
+                        start_time = chunk['offset'] / 10000000.0
+                        end_time = (chunk['offset'] + chunk['duration']) / 10000000.0
+                        word_timings.append((chunk['text'], start_time, end_time))
+                    elif chunk['type'] == 'audio':
+                        if first_audio_latency is None:
+                            first_audio_latency = time.monotonic() - started
+                        f.write(chunk['data'])
+
+            if first_audio_latency is not None:
+                logging.debug("Edge TTS first audio chunk after %.3fs", first_audio_latency)
+
             return word_timings
             
         except Exception as e:
@@ -84,26 +87,7 @@ class EdgeTTS(TTSBase):
         # Get raw timing data (which also generates the audio)
         raw_timings = await self.get_raw_timing_data(text, output_path)
         
-        # Get actual audio duration
-        try:
-            from .. import audio
-        except ImportError:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import audio
-        duration = await audio.get_audio_duration(output_path)
-        
-        # Process timing data using the centralized calculator
-        try:
-            from ..timing_calculator import process_tts_timing_data
-        except ImportError:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import timing_calculator
-            process_tts_timing_data = timing_calculator.process_tts_timing_data
-        return process_tts_timing_data(text, raw_timings, duration)
+        return await self._process_raw_timing_data(text, raw_timings, output_path)
 
     async def generate_audio(self, text: str, output_path: str):
         """Generates audio from text using edge-tts and saves it to a file."""
@@ -122,17 +106,12 @@ class EdgeTTS(TTSBase):
             return
 
         self.console.print("[bold cyan]Warming up the Edge TTS model...[/bold cyan]")
-        warmup_file = os.path.join(config.AUDIO_DATA_DIR, f".warmup_edge.{self.output_format}")
         try:
-            await self.generate_audio("Ready.", warmup_file)
+            # Only the round trip matters here, the audio is discarded instead of written to disk
+            async for _ in self.edge_tts.Communicate("Ready.", self.voice).stream():
+                pass
             self.console.print("[green]Edge TTS model is ready.[/green]")
         except Exception as e:
             self.console.print(f"[bold yellow]Warning: Edge model warm-up failed.[/bold yellow]")
             self.console.print(f"[yellow]This may indicate a network issue or an invalid voice name: {self.voice}[/yellow]")
-            logging.warning(f"Edge TTS model warm-up failed: {e}", exc_info=True)
-        finally:
-            if os.path.exists(warmup_file):
-                try:
-                    os.remove(warmup_file)
-                except OSError:
-                    pass
\ No newline at end of file
+            logging.warning(f"Edge TTS model warm-up failed: {e}", exc_info=True)
\ No newline at end of file
@@ -4,9 +4,11 @@ import warnings
 import asyncio
 import logging
 import re
+import threading
+from functools import lru_cache
 from rich.console import Console
 
-from .base import TTSBase
+from .base import TTSBase, is_package_available
 from .. import config
 
 warnings.filterwarnings("ignore")
@@ -14,6 +16,45 @@ os.environ["HF_HUB_DISABLE_TELEMETRY"] = "1"
 os.environ["HF_HUB_ETAG_TIMEOUT"] = "10"
 os.environ["HF_HUB_DOWNLOAD_TIMEOUT"] = "10"
 
+# Packages imported by initialize(), checked up front so a missing one is reported before
+# paying for the heavy imports (torch is pulled in by kokoro)
+_REQUIRED_PACKAGES = ("numpy", "soundfile", "kokoro", "huggingface_hub")
+
+# Loaded pipelines shared by every KokoroTTS instance in the process, keyed by language code
+_PIPELINE_CACHE = {}
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
+# Serializes inference, a cancelled sentence keeps running in its executor thread and would
+# otherwise compete for the same model and CPU cores with the sentence that replaced it
+_INFERENCE_LOCK = threading.Lock()
+
+# (language, voice) pairs whose shared pipeline has already run its warm-up inference
+_WARMED_UP = set()
+
+_HIGHLIGHTABLE_CHAR = re.compile(r'[a-zA-Z0-9]')
+
+# Sample rate of the audio produced by Kokoro
+SAMPLE_RATE = 24000
+
+# Token tags that never carry a word timing
+_PUNCTUATION_TAGS = frozenset(['.', ',', '!', '?', ':', ';'])
+
+
+@lru_cache(maxsize=None)
+def _check_gpu_acceleration():
+    """Probes the available GPU backends once, every KokoroTTS instance shares the result."""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "NVIDIA CUDA GPU available.", True
+        if torch.backends.mps.is_available() and platform.system() == "Darwin":
+            return "Apple Metal (MPS) GPU available.", True
+        return "No compatible GPU found. Using CPU.", False
+    except ImportError:
+        return "PyTorch not found. Using CPU.", False
+    except Exception as e:
+        return f"Error checking for GPU ({e}). Using CPU.", False
+
 
 class KokoroTTS(TTSBase):
     """TTS implementation for Kokoro TTS."""
@@ -70,6 +111,11 @@ class KokoroTTS(TTSBase):
 
     async def initialize(self) -> bool:
         """Initializes the Kokoro TTS pipeline asynchronously."""
+        missing = [package for package in _REQUIRED_PACKAGES if not is_package_available(package)]
+        if missing:
+            self._report_missing_package(missing[0])
+            return False
+
         try:
             import numpy
             import soundfile as sf
@@ -86,10 +132,7 @@ class KokoroTTS(TTSBase):
             logging.error("SystemExit was called during Kokoro TTS import.")
             return False
         except ImportError as e:
-            package = str(e).split("'")[1]
-            self.console.print(f"[bold red]Error: '{package}' package not found.[/bold red]")
-            self.console.print(f"[yellow]Please ensure torch, kokoro, soundfile, etc. are installed to use this TTS model.[/yellow]")
-            logging.error(f"'{package}' is not installed for Kokoro TTS.")
+            self._report_missing_package(str(e).split("'")[1])
             return False
 
         self._patch_hf_downloader()
@@ -99,20 +142,29 @@ class KokoroTTS(TTSBase):
             gpu_msg, use_gpu = self._get_gpu_acceleration()
             pipeline, error_msg, device_used = None, None, None
 
-            if use_gpu:
-                device_to_try = "mps" if platform.system() == "Darwin" else "cuda"
-                try:
-                    pipeline = self.KPipeline(repo_id="hexgrad/Kokoro-82M", device=device_to_try, lang_code=self.lang)
-                    device_used = device_to_try
-                except Exception as gpu_error:
-                    error_msg = f"Failed to initialize on GPU ({device_to_try}): {gpu_error}"
-
-            if pipeline is None:
-                try:
-                    pipeline = self.KPipeline(repo_id="hexgrad/Kokoro-82M", device="cpu", lang_code=self.lang)
-                    device_used = "cpu"
-                except Exception as cpu_error:
-                    error_msg = f"Failed to initialize on CPU: {cpu_error}"
+            with _PIPELINE_CACHE_LOCK:
+                # The model is only loaded once per language, later instances reuse it
+                if self.lang in _PIPELINE_CACHE:
+                    pipeline, device_used = _PIPELINE_CACHE[self.lang]
+                    return pipeline, (gpu_msg, error_msg), device_used
+
+                if use_gpu:
+                    device_to_try = "mps" if platform.system() == "Darwin" else "cuda"
+                    try:
+                        pipeline = self.KPipeline(repo_id="hexgrad/Kokoro-82M", device=device_to_try, lang_code=self.lang)
+                        device_used = device_to_try
+                    except Exception as gpu_error:
+                        error_msg = f"Failed to initialize on GPU ({device_to_try}): {gpu_error}"
+
+                if pipeline is None:
+                    try:
+                        pipeline = self.KPipeline(repo_id="hexgrad/Kokoro-82M", device="cpu", lang_code=self.lang)
+                        device_used = "cpu"
+                    except Exception as cpu_error:
+                        error_msg = f"Failed to initialize on CPU: {cpu_error}"
+
+                if pipeline is not None:
+                    _PIPELINE_CACHE[self.lang] = (pipeline, device_used)
 
             return pipeline, (gpu_msg, error_msg), device_used
 
@@ -136,40 +188,96 @@ class KokoroTTS(TTSBase):
             logging.error("Kokoro async initialization failed.", exc_info=True)
             return False
 
+    def _report_missing_package(self, package):
+        """Tells the user which package Kokoro needs but could not find."""
+        self.console.print(f"[bold red]Error: '{package}' package not found.[/bold red]")
+        self.console.print(f"[yellow]Please ensure torch, kokoro, soundfile, etc. are installed to use this TTS model.[/yellow]")
+        logging.error(f"'{package}' is not installed for Kokoro TTS.")
+
     async def warm_up(self):
         """Performs a short TTS generation to load the model into memory."""
         if not self.initialized:
             return
 
+        # A pipeline shared with an earlier instance has already loaded this voice
+        if (self.lang, self.voice) in _WARMED_UP:
+            self.console.print("[green]Kokoro TTS model is ready.[/green]")
+            return
+
         self.console.print("[bold cyan]Warming up the Kokoro TTS model... (this may take a minute)[/bold cyan]")
-        warmup_file = os.path.join(config.AUDIO_DATA_DIR, f".warmup_kokoro.{self.output_format}")
+
+        def _blocking_warm_up():
+            # Only the inference matters here, the audio is discarded instead of written to disk
+            with _INFERENCE_LOCK:
+                for _ in self._iter_chunks("Ready."):
+                    pass
 
         try:
-            await self.generate_audio("Ready.", warmup_file)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _blocking_warm_up)
+            _WARMED_UP.add((self.lang, self.voice))
             self.console.print("[green]Kokoro TTS model is ready.[/green]")
         except Exception as e:
             self.console.print(f"[bold yellow]Warning: Kokoro model warm-up failed.[/bold yellow]")
             logging.warning(f"Kokoro TTS warm-up failed: {e}", exc_info=True)
-        finally:
-            if os.path.exists(warmup_file):
-                try:
-                    os.remove(warmup_file)
-                except OSError:
-                    pass
 
     def _get_gpu_acceleration(self):
         """Checks for available GPU acceleration."""
-        try:
-            import torch
-            if torch.cuda.is_available():
-                return "NVIDIA CUDA GPU available.", True
-            if torch.backends.mps.is_available() and platform.system() == "Darwin":
-                return "Apple Metal (MPS) GPU available.", True
-            return "No compatible GPU found. Using CPU.", False
-        except ImportError:
-            return "PyTorch not found. Using CPU.", False
-        except Exception as e:
-            return f"Error checking for GPU ({e}). Using CPU.", False
+        return _check_gpu_acceleration()
+
+    def _iter_chunks(self, text):
+        """
+        Runs the pipeline on text, yielding (audio, word_timings) for each chunk as soon as
+        Kokoro produces it.
+
+        Token timestamps are relative to their own chunk, so they are shifted by the duration
+        of the preceding chunks to place them on the timeline of the whole text.
+        """
+        offset = 0.0
+        for result in self.pipeline(text, voice=self.voice, split_pattern=None):
+            audio = result.audio
+            word_timings = []
+
+            # Extract precise timing information from tokens
+            tokens = getattr(result, 'tokens', None)
+            if tokens:
+                for token in tokens:
+                    # Skip punctuation tokens for word timing
+                    if token.tag in _PUNCTUATION_TAGS:
+                        continue
+
+                    # Use the actual text and timing from the token
+                    word = token.text
+                    start_time = token.start_ts
+                    end_time = token.end_ts
+
+                    # Filter out None values which can cause errors in timing calculations
+                    if start_time is not None and end_time is not None:
+                        # Only include tokens that contain alphanumeric characters
+                        # This ensures consistency with the timing calculator and UI
+                        if _HIGHLIGHTABLE_CHAR.search(word):
+                            word_timings.append((word, start_time + offset, end_time + offset))
+
+            yield audio, word_timings
+            offset += len(audio) / SAMPLE_RATE
+
+    def _synthesize(self, text, output_path):
+        """
+        Runs the pipeline on text, writing each chunk's audio to output_path as it is produced
+        so the whole sentence never has to be held and copied in memory.
+
+        Returns:
+            tuple: (word_timings, frames) for the whole text, frames being the number of
+            audio samples written
+        """
+        word_timings = []
+        frames = 0
+        with _INFERENCE_LOCK, self.sf.SoundFile(output_path, 'w', samplerate=SAMPLE_RATE, channels=1) as f:
+            for audio, chunk_timings in self._iter_chunks(text):
+                f.write(audio)
+                frames += len(audio)
+                word_timings.extend(chunk_timings)
+        return word_timings, frames
 
     async def get_raw_timing_data(self, text: str, output_path: str):
         """
@@ -178,48 +286,18 @@ class KokoroTTS(TTSBase):
         Returns:
             List of (word, start_time, end_time) tuples with raw timing data from Kokoro TTS
         """
+        word_timings, _ = await self._generate_with_frames(text, output_path)
+        return word_timings
+
+    async def _generate_with_frames(self, text: str, output_path: str):
+        """Generates audio in a separate thread, returning (word_timings, frames written)."""
         if not self.initialized or not self.pipeline:
             raise RuntimeError("Kokoro TTS has not been initialized.")
 
         def _blocking_generate():
             try:
-                # Generate audio with timing information
-                results = list(self.pipeline(text, voice=self.voice, split_pattern=None))
-
-                if results:
-                    # Concatenate all audio segments
-                    audio_segments = [result.audio for result in results]
-                    full_audio = self.np.concatenate(audio_segments)
-                    self.sf.write(output_path, full_audio, 24000)
-
-                    # Extract precise timing information from tokens
-                    word_timings = []
-
-                    # Process each result to extract word-level timing
-                    for result in results:
-                        if hasattr(result, 'tokens') and result.tokens:
-                            # Extract timing from tokens
-                            for token in result.tokens:
-                                # Skip punctuation tokens for word timing
-                                if token.tag in ['.', ',', '!', '?', ':', ';']:
-                                    continue
-
-                                # Use the actual text and timing from the token
-                                word = token.text
-                                start_time = token.start_ts
-                                end_time = token.end_ts
-
-                                # Filter out None values which can cause errors in timing calculations
-                                if start_time is not None and end_time is not None:
-                                    # Only include tokens that contain alphanumeric characters
-                                    # This ensures consistency with the timing calculator and UI
-                                    if re.search(r'[a-zA-Z0-9]', word):
-                                        word_timings.append((word, start_time, end_time))
-
-                    return word_timings
-                else:
-                    self.sf.write(output_path, self.np.array([], dtype=self.np.float32), 24000)
-                    return []
+                # Generate audio with timing information, handling each chunk as the pipeline yields it
+                return self._synthesize(text, output_path)
             except Exception as e:
                 logging.error(f"Error during Kokoro audio generation for text '{text[:50]}...': {e}", exc_info=True)
                 raise e
@@ -235,28 +313,10 @@ class KokoroTTS(TTSBase):
         through get_raw_timing_data() and processes it with the timing calculator.
         """
         # Get raw timing data (which also generates the audio)
-        raw_timings = await self.get_raw_timing_data(text, output_path)
+        raw_timings, frames = await self._generate_with_frames(text, output_path)
 
-        # Get actual audio duration
-        try:
-            from .. import audio
-        except ImportError:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import audio
-        duration = await audio.get_audio_duration(output_path)
-
-        # Process timing data using the centralized calculator
-        try:
-            from ..timing_calculator import process_tts_timing_data
-        except ImportError:
-            import sys
-            import os
-            sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-            import timing_calculator
-            process_tts_timing_data = timing_calculator.process_tts_timing_data
-        return process_tts_timing_data(text, raw_timings, duration)
+        # The length of the written audio is already known, so the file does not need probing
+        return await self._process_raw_timing_data(text, raw_timings, output_path, duration=frames / SAMPLE_RATE)
 
     async def generate_audio(self, text: str, output_path: str):
         """Generates audio from text using Kokoro in a separate thread."""
@@ -265,12 +325,7 @@ class KokoroTTS(TTSBase):
 
         def _blocking_generate():
             try:
-                audio_segments = [result.audio for result in self.pipeline(text, voice=self.voice, split_pattern=None)]
-                if audio_segments:
-                    full_audio = self.np.concatenate(audio_segments)
-                    self.sf.write(output_path, full_audio, 24000)
-                else:
-                    self.sf.write(output_path, self.np.array([], dtype=self.np.float32), 24000)
+                self._synthesize(text, output_path)
             except Exception as e:
                 logging.error(f"Error during Kokoro audio generation for text '{text[:50]}...': {e}", exc_info=True)
                 raise e
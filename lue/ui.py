@@ -1,13 +1,14 @@
-import asyncio
+import bisect
+import itertools
 import os
 import sys
-import platform
 import re
-from rich.console import Console
-from rich.text import Text
+import time
+from array import array
+from dataclasses import dataclass
+from rich.text import Text, Span
 from rich.panel import Panel
 from rich.table import Table
-from rich.align import Align
 from rich import box
 from . import input_handler, config
 from . import content_parser
@@ -49,160 +50,242 @@ class UIIcons:
     LINE_SEPARATOR_MEDIUM = "──"
     LINE_SEPARATOR_SHORT = "─"
 
+@dataclass(frozen=True)
 class UIColors:
     """Central place to configure all UI colors and styles."""
     
     # Status colors
-    PLAYING_STATUS = "green"
-    PAUSED_STATUS = "yellow"
+    PLAYING_STATUS: str = "green"
+    PAUSED_STATUS: str = "yellow"
     
     # Mode colors
-    AUTO_SCROLL_ENABLED = "magenta"
-    AUTO_SCROLL_DISABLED = "blue"
+    AUTO_SCROLL_ENABLED: str = "magenta"
+    AUTO_SCROLL_DISABLED: str = "blue"
     
     # Control and navigation colors
-    CONTROL_KEYS = "white"          # h, j, k, l, etc.
-    CONTROL_ICONS = "green"   # The actual navigation icons
-    ARROW_ICONS = "blue"  # Color for u/n and i/m icons
-    QUIT_ICON = "red"        # Color for the q icon
-    SEPARATORS = "bright_blue"      # Lines and separators
+    CONTROL_KEYS: str = "white"          # h, j, k, l, etc.
+    CONTROL_ICONS: str = "green"   # The actual navigation icons
+    ARROW_ICONS: str = "blue"  # Color for u/n and i/m icons
+    QUIT_ICON: str = "red"        # Color for the q icon
+    SEPARATORS: str = "bright_blue"      # Lines and separators
     
     # Panel and UI structure
-    PANEL_BORDER = "bright_blue"
-    PANEL_TITLE = "bold blue"
+    PANEL_BORDER: str = "bright_blue"
+    PANEL_TITLE: str = "bold blue"
     
     # Text content colors
-    TEXT_NORMAL = "white"      # Normal reading text
-    TEXT_HIGHLIGHT = "bold magenta" # Current sentence highlight
-    WORD_HIGHLIGHT = "bold yellow"  # Current word highlight
-    WORD_HIGHLIGHT_STANDOUT = "black on bright_yellow"  # Standout mode word highlight
-    SPEED_READING_TEXT = "bold white"  # Centered speed reading word
-    SELECTION_HIGHLIGHT = "reverse" # Text selection highlight
+    TEXT_NORMAL: str = "white"      # Normal reading text
+    TEXT_HIGHLIGHT: str = "bold magenta" # Current sentence highlight
+    WORD_HIGHLIGHT: str = "bold yellow"  # Current word highlight
+    WORD_HIGHLIGHT_STANDOUT: str = "black on bright_yellow"  # Standout mode word highlight
+    SPEED_READING_TEXT: str = "bold white"  # Centered speed reading word
+    SELECTION_HIGHLIGHT: str = "reverse" # Text selection highlight
     
     # Progress bar colors
-    PROGRESS_BAR = "bold blue"  # Used for the progress text in title
-    
-    # You can easily add theme presets here:
-    @classmethod
-    def apply_black_theme(cls):
-        """Apply a dark theme color scheme with grayscale only."""
-        # Dark theme base colors - using only grayscale
-        cls.PLAYING_STATUS = "white"
-        cls.PAUSED_STATUS = "white"
-        cls.AUTO_SCROLL_ENABLED = "white"
-        cls.AUTO_SCROLL_DISABLED = "white"
-        cls.CONTROL_KEYS = "white"
-        cls.CONTROL_ICONS = "white"
-        cls.ARROW_ICONS = "white"
-        cls.QUIT_ICON = "white"
-        cls.SEPARATORS = "white"
-        cls.PANEL_BORDER = "white"
-        cls.PANEL_TITLE = "white"
-        cls.PROGRESS_BAR = "white"
-        cls.TEXT_NORMAL = "white"
-        cls.TEXT_HIGHLIGHT = "grey70"
-        cls.WORD_HIGHLIGHT = "white"
-        cls.WORD_HIGHLIGHT_STANDOUT = "black on white"
-        cls.SPEED_READING_TEXT = "bold white"
-        cls.SELECTION_HIGHLIGHT = "on grey50"
-    
-    @classmethod
-    def apply_white_theme(cls):
-        """Apply a light theme color scheme with grayscale only."""
-        # Light theme base colors - using only grayscale
-        cls.PLAYING_STATUS = "black"
-        cls.PAUSED_STATUS = "black"
-        cls.AUTO_SCROLL_ENABLED = "black"
-        cls.AUTO_SCROLL_DISABLED = "black"
-        cls.CONTROL_KEYS = "black"
-        cls.CONTROL_ICONS = "black"
-        cls.ARROW_ICONS = "black"
-        cls.QUIT_ICON = "black"
-        cls.SEPARATORS = "black"
-        cls.PANEL_BORDER = "black"
-        cls.PANEL_TITLE = "black"
-        cls.PROGRESS_BAR = "black"
-        cls.TEXT_NORMAL = "black"
-        cls.TEXT_HIGHLIGHT = "grey30"
-        cls.WORD_HIGHLIGHT = "black"
-        cls.WORD_HIGHLIGHT_STANDOUT = "white on black"
-        cls.SPEED_READING_TEXT = "bold black"
-        cls.SELECTION_HIGHLIGHT = "on grey50"
-    
+    PROGRESS_BAR: str = "bold blue"  # Used for the progress text in title
+
+# Theme presets, applied by swapping which one COLORS refers to
+DEFAULT_THEME = UIColors()
+
+# Dark theme color scheme with grayscale only
+BLACK_THEME = UIColors(
+    PLAYING_STATUS="white",
+    PAUSED_STATUS="white",
+    AUTO_SCROLL_ENABLED="white",
+    AUTO_SCROLL_DISABLED="white",
+    CONTROL_KEYS="white",
+    CONTROL_ICONS="white",
+    ARROW_ICONS="white",
+    QUIT_ICON="white",
+    SEPARATORS="white",
+    PANEL_BORDER="white",
+    PANEL_TITLE="white",
+    PROGRESS_BAR="white",
+    TEXT_NORMAL="white",
+    TEXT_HIGHLIGHT="grey70",
+    WORD_HIGHLIGHT="white",
+    WORD_HIGHLIGHT_STANDOUT="black on white",
+    SPEED_READING_TEXT="bold white",
+    SELECTION_HIGHLIGHT="on grey50",
+)
+
+# Light theme color scheme with grayscale only
+WHITE_THEME = UIColors(
+    PLAYING_STATUS="black",
+    PAUSED_STATUS="black",
+    AUTO_SCROLL_ENABLED="black",
+    AUTO_SCROLL_DISABLED="black",
+    CONTROL_KEYS="black",
+    CONTROL_ICONS="black",
+    ARROW_ICONS="black",
+    QUIT_ICON="black",
+    SEPARATORS="black",
+    PANEL_BORDER="black",
+    PANEL_TITLE="black",
+    PROGRESS_BAR="black",
+    TEXT_NORMAL="black",
+    TEXT_HIGHLIGHT="grey30",
+    WORD_HIGHLIGHT="black",
+    WORD_HIGHLIGHT_STANDOUT="white on black",
+    SPEED_READING_TEXT="bold black",
+    SELECTION_HIGHLIGHT="on grey50",
+)
+
 # Create global instances for easy access
 ICONS = UIIcons()
-COLORS = UIColors()
+COLORS = DEFAULT_THEME
+
+# Bumped whenever a theme is applied so cached markup can be invalidated
+_theme_version = 0
+
+def apply_theme(theme):
+    """Make the given theme the current color scheme."""
+    global COLORS, _theme_version
+    COLORS = theme
+    _theme_version += 1
+
+def apply_black_theme():
+    """Apply a dark theme color scheme with grayscale only."""
+    apply_theme(BLACK_THEME)
+
+def apply_white_theme():
+    """Apply a light theme color scheme with grayscale only."""
+    apply_theme(WHITE_THEME)
 
 # Uncomment one of these to apply a different theme:
-# COLORS.apply_black_theme()
-# COLORS.apply_white_theme()
+# apply_black_theme()
+# apply_white_theme()
+
+# Patterns used when splitting the current sentence into highlightable words
+_LEADING_WS = re.compile(r"^(\s+)")
+_WORD_SEPARATOR = re.compile(r'([—-])')
+_HIGHLIGHTABLE_CHAR = re.compile(r'[a-zA-Z0-9]')
+_RICH_MARKUP_TAG = re.compile(r'\[/?[^\]]*\]')
+
+# Seconds a terminal size lookup is reused, so one frame only queries the tty once
+TERMINAL_SIZE_TTL = 0.05
+_TERM_SIZE_CACHE = {'t': None, 'v': (80, 24)}
 
 def get_terminal_size():
     """Get terminal size."""
+    now = time.monotonic()
+    if _TERM_SIZE_CACHE['t'] is not None and now - _TERM_SIZE_CACHE['t'] < TERMINAL_SIZE_TTL:
+        return _TERM_SIZE_CACHE['v']
     try:
         columns, rows = os.get_terminal_size()
-        return columns, rows
+        size = (columns, rows)
     except OSError:
-        return 80, 24
-
-def update_document_layout(reader):
-    """Update the document layout based on terminal size."""
+        size = (80, 24)
+    _TERM_SIZE_CACHE['t'] = now
+    _TERM_SIZE_CACHE['v'] = size
+    return size
+
+def invalidate_terminal_size():
+    """Force the next get_terminal_size call to query the terminal, e.g. after SIGWINCH."""
+    _TERM_SIZE_CACHE['t'] = None
+
+# Number of distinct layout widths whose wrapped paragraphs are kept in memory
+WRAP_CACHE_MAX_WIDTHS = 4
+
+def _get_paragraph_sentences(reader, chap_idx, para_idx):
+    """Return the sentences of a paragraph, splitting it only once per loaded document."""
+    key = (chap_idx, para_idx)
+    sentences = reader._sentence_cache.get(key)
+    if sentences is None:
+        sentences = content_parser.split_into_sentences(reader.chapters[chap_idx][para_idx])
+        reader._sentence_cache[key] = sentences
+    return sentences
+
+def _get_wrapped_paragraph(reader, chap_idx, para_idx, available_width):
+    """Return the wrapped lines of a paragraph, reusing earlier wraps at the same width."""
+    width_cache = reader._wrap_cache.get(available_width)
+    if width_cache is None:
+        width_cache = reader._wrap_cache[available_width] = {}
+        if len(reader._wrap_cache) > WRAP_CACHE_MAX_WIDTHS:
+            reader._wrap_cache.popitem(last=False)
+    else:
+        reader._wrap_cache.move_to_end(available_width)
+    
+    key = (chap_idx, para_idx)
+    wrapped_lines = width_cache.get(key)
+    if wrapped_lines is None:
+        paragraph = reader.chapters[chap_idx][para_idx]
+        plain_text = Text(paragraph, justify="left", no_wrap=False, style=COLORS.TEXT_NORMAL)
+        wrapped_lines = plain_text.wrap(reader.console, available_width)
+        width_cache[key] = wrapped_lines
+    return wrapped_lines
+
+
+def _build_document_lines(reader, available_width):
+    """Rebuild the document lines and position mappings for a wrap width."""
     reader.document_lines = []
-    reader.line_to_position = {}
+    reader.line_chap = array('i')
+    reader.line_para = array('i')
+    reader.line_plain_lens = array('i')
     reader.position_to_line = {}
+    reader.sentence_lines = array('i')
+    reader.sentence_positions = []
     reader.paragraph_line_ranges = {}
-    
-    width, _ = get_terminal_size()
-    
-    # Adjust available width based on UI mode
-    if config.UI_MODE == 0 or config.UI_MODE == 3:
-        # Mode 0 or 3: Full screen width for text
-        available_width = width
-    else:
-        # Mode 1 and 2: Account for borders and padding
-        available_width = max(20, width - 10)
+    reader._themed_lines = {}
     
     for chap_idx, chapter in enumerate(reader.chapters):
         if chap_idx > 0:
-            reader.document_lines.append(Text("", style=COLORS.TEXT_NORMAL))
+            _append_blank_document_line(reader)
             
         for para_idx, paragraph in enumerate(chapter):
             paragraph_start_line = len(reader.document_lines)
             
-            plain_text = Text(paragraph, justify="left", no_wrap=False, style=COLORS.TEXT_NORMAL)
-            wrapped_lines = plain_text.wrap(reader.console, available_width)
+            wrapped_lines = _get_wrapped_paragraph(reader, chap_idx, para_idx, available_width)
             paragraph_end_line = len(reader.document_lines) + len(wrapped_lines) - 1
             
             reader.paragraph_line_ranges[(chap_idx, para_idx)] = (paragraph_start_line, paragraph_end_line)
             
-            sentences = content_parser.split_into_sentences(paragraph)
+            # Cumulative character offsets of the line ends, used to locate each sentence's first line
+            line_lens = [len(line.plain) for line in wrapped_lines]
+            line_ends = list(itertools.accumulate(line_lens))
+            
+            sentences = _get_paragraph_sentences(reader, chap_idx, para_idx)
             current_char_pos = 0
             for sent_idx, sentence in enumerate(sentences):
-                sentence_start = current_char_pos
-                sentence_end = current_char_pos + len(sentence)
+                line_idx = bisect.bisect_right(line_ends, current_char_pos)
+                if line_idx < len(line_ends):
+                    reader.position_to_line[(chap_idx, para_idx, sent_idx)] = paragraph_start_line + line_idx
+                    reader.sentence_lines.append(paragraph_start_line + line_idx)
+                    reader.sentence_positions.append((chap_idx, para_idx, sent_idx))
                 
-                line_char_pos = 0
-                for line_idx, line in enumerate(wrapped_lines):
-                    line_start = line_char_pos
-                    line_end = line_char_pos + len(line.plain)
-                    
-                    if line_start <= sentence_start < line_end:
-                        global_line_idx = paragraph_start_line + line_idx
-                        reader.position_to_line[(chap_idx, para_idx, sent_idx)] = global_line_idx
-                        break
-                    
-                    line_char_pos = line_end
-                
-                current_char_pos = sentence_end + 1
-            
-            for line_idx in range(len(wrapped_lines)):
-                global_line_idx = paragraph_start_line + line_idx
-                reader.line_to_position[global_line_idx] = (chap_idx, para_idx, 0)
+                current_char_pos += len(sentence) + 1
             
             reader.document_lines.extend(wrapped_lines)
+            reader.line_chap.extend([chap_idx] * len(wrapped_lines))
+            reader.line_para.extend([para_idx] * len(wrapped_lines))
+            reader.line_plain_lens.extend(line_lens)
             
             if para_idx < len(chapter) - 1:
-                reader.document_lines.append(Text("", style=COLORS.TEXT_NORMAL))
+                _append_blank_document_line(reader)
+
+def _append_blank_document_line(reader):
+    """Append a separator line that belongs to no paragraph."""
+    reader.document_lines.append(Text("", style=COLORS.TEXT_NORMAL))
+    reader.line_chap.append(-1)
+    reader.line_para.append(-1)
+    reader.line_plain_lens.append(0)
+
+def update_document_layout(reader):
+    """Update the document layout based on terminal size."""
+    width, _ = get_terminal_size()
+    
+    # Adjust available width based on UI mode
+    if config.UI_MODE == 0 or config.UI_MODE == 3:
+        # Mode 0 or 3: Full screen width for text
+        available_width = width
+    else:
+        # Mode 1 and 2: Account for borders and padding
+        available_width = max(20, width - 10)
+    
+    # The line layout only depends on the wrap width, so skip the rebuild when it is unchanged
+    if available_width != reader._last_layout_width:
+        _build_document_lines(reader, available_width)
+        reader._last_layout_width = available_width
 
     if hasattr(reader, '_initial_load_complete') and reader._initial_load_complete:
         scroll_was_set = False
@@ -240,8 +323,8 @@ def get_current_word(reader):
     except (AttributeError, IndexError):
         return ""
 
-    fallback_words = [token for token in sentence.split() if re.search(r'[a-zA-Z0-9]', token)]
-    return fallback_words[0] if fallback_words else ""
+    # Only the first highlightable word is needed, stop scanning as soon as it is found
+    return next((token for token in sentence.split() if _HIGHLIGHTABLE_CHAR.search(token)), "")
 
 
 def render_speed_reading_output(reader, width, height, console):
@@ -255,17 +338,15 @@ def render_speed_reading_output(reader, width, height, console):
         word_width = Text(escaped_word).cell_len
     center_x = max(0, (width - word_width) // 2)
 
+    # Blank rows above and below the word are appended as one block each rather than row by row
     padded_content = Text()
-    for line_idx in range(height):
-        if line_idx == center_y:
-            padded_content.append(" " * center_x)
-            padded_content.append(escaped_word, style=COLORS.SPEED_READING_TEXT)
-            padded_content.append(" " * max(0, width - center_x - word_width))
-        else:
-            padded_content.append(" " * width)
-
-        if line_idx < height - 1:
-            padded_content.append("\n")
+    if height > 0:
+        blank_row = " " * width
+        padded_content.append((blank_row + "\n") * center_y)
+        padded_content.append(" " * center_x)
+        padded_content.append(escaped_word, style=COLORS.SPEED_READING_TEXT)
+        padded_content.append(" " * max(0, width - center_x - word_width))
+        padded_content.append(("\n" + blank_row) * (height - center_y - 1))
 
     with console.capture() as capture:
         console.print(padded_content, end='', overflow='crop')
@@ -282,6 +363,156 @@ def _apply_current_text_color(line):
     return new_line
 
 
+def _get_themed_line(reader, line_index):
+    """Get a document line in the current theme's text color, reusing it until the theme changes."""
+    if reader._themed_lines_version != _theme_version:
+        reader._themed_lines = {}
+        reader._themed_lines_version = _theme_version
+    
+    line = reader._themed_lines.get(line_index)
+    if line is None:
+        line = reader._themed_lines[line_index] = _apply_current_text_color(reader.document_lines[line_index])
+    return line
+
+def _build_highlighted_paragraph(reader, available_width, word_highlighting):
+    """
+    Wrap the current paragraph with sentence highlighting applied.
+    
+    Highlightable word parts of the current sentence get their own spans so the
+    word highlight can be applied to the wrapped lines afterwards.
+    
+    Returns:
+        Tuple of (unwrapped text, wrapped lines, line start offsets, word spans),
+        where the offsets are None if the wrapped lines could not be mapped back
+        onto the unwrapped text
+    """
+    sentences = _get_paragraph_sentences(reader, reader.ui_chapter_idx, reader.ui_paragraph_idx)
+    highlighted_text = Text(justify="left", no_wrap=False)
+    word_spans = []
+
+    for sent_idx, sentence in enumerate(sentences):
+        is_current_sentence = sent_idx == reader.ui_sentence_idx
+        
+        # Determine the base style for this sentence
+        if is_current_sentence and config.SENTENCE_HIGHLIGHTING_ENABLED:
+            base_style = COLORS.TEXT_HIGHLIGHT
+        else:
+            base_style = COLORS.TEXT_NORMAL
+        
+        # Prepare word-level highlighting if enabled and this is the current sentence
+        if is_current_sentence and word_highlighting:
+            
+            # Preserve leading whitespace from the sentence, which contains paragraph indentation
+            match = _LEADING_WS.match(sentence)
+            leading_whitespace = match.group(1) if match else ""
+            
+            if leading_whitespace:
+                highlighted_text.append(leading_whitespace, style=base_style)
+            
+            # Split sentence into tokens (preserving all original text)
+            tokens = sentence.lstrip().split()
+            
+            for token_idx, token in enumerate(tokens):
+                # Split token on em dash or hyphen, keeping the separator as a separate part
+                sub_parts = _WORD_SEPARATOR.split(token)
+                
+                for part_idx, part in enumerate(sub_parts):
+                    # If part is em dash, hyphen, or non-highlightable (no alnum), append without counting
+                    if part not in ['—', '-'] and _HIGHLIGHTABLE_CHAR.search(part):
+                        # Highlightable word part, remember where it lands in the paragraph
+                        part_start = len(highlighted_text)
+                        word_spans.append((part_start, part_start + len(part)))
+                    highlighted_text.append(part, style=base_style)
+                
+                # Add space after the full token (not between sub-parts)
+                if token_idx < len(tokens) - 1:
+                    highlighted_text.append(" ", style=base_style)
+        else:
+            # No word highlighting, just apply the base style to the entire sentence
+            highlighted_text.append(sentence, style=base_style)
+        
+        if sent_idx < len(sentences) - 1:
+            highlighted_text.append(" ", style=COLORS.TEXT_NORMAL)
+
+    wrapped_lines = highlighted_text.wrap(reader.console, available_width)
+    
+    # Locate each wrapped line in the paragraph text. Wrapping only drops whitespace
+    # between lines, so a forward search is enough unless tabs were expanded.
+    plain = highlighted_text.plain
+    line_offsets = []
+    search_from = 0
+    for line in wrapped_lines:
+        line_plain = line.plain
+        offset = plain.find(line_plain, search_from)
+        if offset < 0:
+            line_offsets = None
+            break
+        line_offsets.append(offset)
+        search_from = offset + len(line_plain)
+    
+    return highlighted_text, wrapped_lines, line_offsets, word_spans
+
+
+def _restyle_span(text, start, end, style):
+    """Return a copy of a Text with the spans inside [start, end) restyled."""
+    text = text.copy()
+    text.spans = [
+        Span(span.start, span.end, style) if start <= span.start and span.end <= end else span
+        for span in text.spans
+    ]
+    return text
+
+
+def _get_highlighted_paragraph_lines(reader, available_width):
+    """
+    Get the wrapped lines of the current paragraph with sentence and word highlighting.
+    
+    The sentence-highlighted wrap is cached on the reader, so word index changes
+    within the same sentence only restyle the lines that contain the word, and
+    frames with an unchanged word reuse the previous lines as they are.
+    """
+    word_highlighting = config.WORD_HIGHLIGHT_MODE > 0 and hasattr(reader, 'ui_word_idx')
+    key = (
+        reader.ui_chapter_idx, reader.ui_paragraph_idx, reader.ui_sentence_idx, available_width,
+        config.SENTENCE_HIGHLIGHTING_ENABLED, word_highlighting, _theme_version
+    )
+    lines_key = (key, config.WORD_HIGHLIGHT_MODE, reader.ui_word_idx if word_highlighting else None)
+    if reader._highlight_lines_cache is not None and reader._highlight_lines_cache[0] == lines_key:
+        return reader._highlight_lines_cache[1]
+    
+    cached = reader._highlight_cache
+    if cached is None or cached[0] != key:
+        cached = reader._highlight_cache = (key, *_build_highlighted_paragraph(reader, available_width, word_highlighting))
+    
+    lines = _highlight_current_word(reader, available_width, cached, word_highlighting)
+    reader._highlight_lines_cache = (lines_key, lines)
+    return lines
+
+
+def _highlight_current_word(reader, available_width, cached, word_highlighting):
+    """Apply the word highlight to a cached sentence-highlighted paragraph."""
+    _, highlighted_text, wrapped_lines, line_offsets, word_spans = cached
+    
+    if not word_highlighting or not 0 <= reader.ui_word_idx < len(word_spans):
+        return wrapped_lines
+    
+    word_style = COLORS.WORD_HIGHLIGHT_STANDOUT if config.WORD_HIGHLIGHT_MODE == 2 else COLORS.WORD_HIGHLIGHT
+    word_start, word_end = word_spans[reader.ui_word_idx]
+    if line_offsets is None:
+        # The wrapped lines can't be mapped back onto the text, so wrap it again with the word styled
+        return _restyle_span(highlighted_text, word_start, word_end, word_style).wrap(reader.console, available_width)
+    
+    # Only the lines containing the word need a restyled copy
+    lines = list(wrapped_lines)
+    first_line = max(0, bisect.bisect_right(line_offsets, word_start) - 1)
+    for line_idx in range(first_line, len(lines)):
+        line_start = line_offsets[line_idx]
+        if line_start >= word_end:
+            break
+        lines[line_idx] = _restyle_span(lines[line_idx], word_start - line_start, word_end - line_start, word_style)
+    return lines
+
+
 def get_visible_content(reader):
     """Get the visible content to display."""
     width, height = get_terminal_size()
@@ -308,79 +539,19 @@ def get_visible_content(reader):
 
     highlighted_paragraph_lines = None
     if current_paragraph_key in reader.paragraph_line_ranges:
-        para_start, para_end = reader.paragraph_line_ranges[current_paragraph_key]
-        paragraph = reader.chapters[reader.ui_chapter_idx][reader.ui_paragraph_idx]
-        sentences = content_parser.split_into_sentences(paragraph)
-        highlighted_text = Text(justify="left", no_wrap=False)
+        highlighted_paragraph_lines = _get_highlighted_paragraph_lines(reader, available_width)
 
-        for sent_idx, sentence in enumerate(sentences):
-            is_current_sentence = sent_idx == reader.ui_sentence_idx
-            
-            # Determine the base style for this sentence
-            if is_current_sentence and config.SENTENCE_HIGHLIGHTING_ENABLED:
-                base_style = COLORS.TEXT_HIGHLIGHT
-            else:
-                base_style = COLORS.TEXT_NORMAL
-            
-            # Apply word-level highlighting if enabled and this is the current sentence
-            if (is_current_sentence and config.WORD_HIGHLIGHT_MODE > 0 and 
-                hasattr(reader, 'ui_word_idx')):
-                
-                # Preserve leading whitespace from the sentence, which contains paragraph indentation
-                leading_whitespace = ""
-                if sentence:
-                    match = re.match(r"^(\s+)", sentence)
-                    if match:
-                        leading_whitespace = match.group(1)
-                
-                if leading_whitespace:
-                    highlighted_text.append(leading_whitespace, style=base_style)
-                
-                # Split sentence into tokens (preserving all original text)
-                tokens = sentence.lstrip().split()
-                
-                # Track index of highlightable words only
-                highlightable_word_count = 0
-                
-                for token_idx, token in enumerate(tokens):
-                    # Split token on em dash or hyphen, keeping the separator as a separate part
-                    sub_parts = re.split(r'([—-])', token)
-                    
-                    for part_idx, part in enumerate(sub_parts):
-                        # If part is em dash, hyphen, or non-highlightable (no alnum), append without counting
-                        if part in ['—', '-'] or not re.search(r'[a-zA-Z0-9]', part):
-                            highlighted_text.append(part, style=base_style)
-                        else:
-                            # Highlightable word part
-                            if highlightable_word_count == reader.ui_word_idx:
-                                word_style = COLORS.WORD_HIGHLIGHT_STANDOUT if config.WORD_HIGHLIGHT_MODE == 2 else COLORS.WORD_HIGHLIGHT
-                                highlighted_text.append(part, style=word_style)
-                            else:
-                                highlighted_text.append(part, style=base_style)
-                            highlightable_word_count += 1
-                    
-                    # Add space after the full token (not between sub-parts)
-                    if token_idx < len(tokens) - 1:
-                        highlighted_text.append(" ", style=base_style)
-            else:
-                # No word highlighting, just apply the base style to the entire sentence
-                highlighted_text.append(sentence, style=base_style)
-            
-            if sent_idx < len(sentences) - 1:
-                highlighted_text.append(" ", style=COLORS.TEXT_NORMAL)
-
-        highlighted_paragraph_lines = highlighted_text.wrap(reader.console, available_width)
+    # Checked once per frame so lines skip selection highlighting when nothing is selected
+    has_selection = bool(reader.selection_active and reader.selection_start and reader.selection_end)
 
     for i in range(start_line, end_line):
         if i < len(reader.document_lines):
-            line = reader.document_lines[i]
-
             # Apply current theme text color
-            line = _apply_current_text_color(line)
+            line = _get_themed_line(reader, i)
 
-            if (i in reader.line_to_position and
-                reader.line_to_position[i][:2] == current_paragraph_key and
-                highlighted_paragraph_lines is not None):
+            if (highlighted_paragraph_lines is not None and
+                reader.line_chap[i] == reader.ui_chapter_idx and
+                reader.line_para[i] == reader.ui_paragraph_idx):
 
                 para_start, para_end = reader.paragraph_line_ranges[current_paragraph_key]
                 line_offset = i - para_start
@@ -388,7 +559,8 @@ def get_visible_content(reader):
                 if 0 <= line_offset < len(highlighted_paragraph_lines):
                     line = highlighted_paragraph_lines[line_offset]
 
-            line = _apply_selection_highlighting(reader, line, i)
+            if has_selection:
+                line = _apply_selection_highlighting(reader, line, i)
 
             visible_lines.append(line)
         else:
@@ -399,11 +571,16 @@ def get_visible_content(reader):
 
     return visible_lines
 
-def _apply_selection_highlighting(reader, line, line_index):
-    """Apply selection highlighting to a line if it's within the selection range."""
-    if not reader.selection_active or not reader.selection_start or not reader.selection_end:
-        return line
+def _build_selection_span_table(reader):
+    """
+    Describe how each selected document line should be highlighted.
     
+    Returns:
+        Dict mapping line index to (kind, start, end), where kind is 'full' for a
+        line inside the selection, 'right' for the first line, 'left' for the last
+        line and 'mid' for a single-line selection, and [start, end) is the
+        selected character range clamped to the line
+    """
     start_line, start_char = reader.selection_start
     end_line, end_char = reader.selection_end
     
@@ -411,68 +588,57 @@ def _apply_selection_highlighting(reader, line, line_index):
     if start_line > end_line or (start_line == end_line and start_char > end_char):
         start_line, start_char, end_line, end_char = end_line, end_char, start_line, start_char
     
-    # Check if this line is within the selection range
-    if not (start_line <= line_index <= end_line):
+    table = {}
+    last_line = min(end_line, len(reader.document_lines) - 1)
+    for line_index in range(max(0, start_line), last_line + 1):
+        line_length = reader.line_plain_lens[line_index]
+        if start_line == end_line:
+            table[line_index] = ('mid', max(0, min(start_char, line_length)), max(0, min(end_char, line_length)))
+        elif line_index == start_line:
+            table[line_index] = ('right', max(0, min(start_char, line_length)), line_length)
+        elif line_index == end_line:
+            table[line_index] = ('left', 0, max(0, min(end_char, line_length)))
+        else:
+            table[line_index] = ('full', 0, line_length)
+    return table
+
+
+def _apply_selection_highlighting(reader, line, line_index):
+    """Apply selection highlighting to a line if it's within the selection range."""
+    if not reader.selection_active or not reader.selection_start or not reader.selection_end:
+        return line
+    
+    # The span table only changes with the selection or the layout
+    selection_key = (reader.selection_start, reader.selection_end, reader._last_layout_width)
+    if reader._selection_span_key != selection_key:
+        reader._selection_span_table = _build_selection_span_table(reader)
+        reader._selection_span_key = selection_key
+    
+    spec = reader._selection_span_table.get(line_index)
+    if not spec:
         return line
     
     line_text = line.plain
     if not line_text:
         return line
     
-    # Create a new Text object with selection highlighting
-    new_line = Text(justify="left", no_wrap=False)
-    
-    if start_line == end_line == line_index:
-        # Single line selection
-        selection_start = max(0, min(start_char, len(line_text)))
-        selection_end = max(0, min(end_char, len(line_text)))
-        
-        # Add text before selection
-        if selection_start > 0:
-            new_line.append(line_text[:selection_start], style=COLORS.TEXT_NORMAL)
-        
-        # Add selected text with highlighting
-        if selection_end > selection_start:
-            new_line.append(line_text[selection_start:selection_end], style=COLORS.SELECTION_HIGHLIGHT)
-        
-        # Add text after selection
-        if selection_end < len(line_text):
-            new_line.append(line_text[selection_end:], style=COLORS.TEXT_NORMAL)
-            
-    elif line_index == start_line:
-        # First line of multi-line selection
-        selection_start = max(0, min(start_char, len(line_text)))
-        
-        # Add text before selection
-        if selection_start > 0:
-            new_line.append(line_text[:selection_start], style=COLORS.TEXT_NORMAL)
-        
-        # Add selected text from start_char to end of line
-        if selection_start < len(line_text):
-            new_line.append(line_text[selection_start:], style=COLORS.SELECTION_HIGHLIGHT)
-            
-    elif line_index == end_line:
-        # Last line of multi-line selection
-        selection_end = max(0, min(end_char, len(line_text)))
-        
-        # Add selected text from beginning to end_char
-        if selection_end > 0:
-            new_line.append(line_text[:selection_end], style=COLORS.SELECTION_HIGHLIGHT)
-        
-        # Add text after selection
-        if selection_end < len(line_text):
-            new_line.append(line_text[selection_end:], style=COLORS.TEXT_NORMAL)
-            
-    else:
-        # Middle line of multi-line selection - entire line is selected
-        new_line.append(line_text, style=COLORS.SELECTION_HIGHLIGHT)
+    kind, selection_start, selection_end = spec
+    if kind == 'full':
+        return Text(line_text, justify="left", no_wrap=False, spans=[Span(0, len(line_text), COLORS.SELECTION_HIGHLIGHT)])
     
-    return new_line
+    spans = []
+    if selection_start > 0:
+        spans.append(Span(0, selection_start, COLORS.TEXT_NORMAL))
+    if selection_end > selection_start:
+        spans.append(Span(selection_start, selection_end, COLORS.SELECTION_HIGHLIGHT))
+    if kind != 'right' and selection_end < len(line_text):
+        spans.append(Span(selection_end, len(line_text), COLORS.TEXT_NORMAL))
+    return Text(line_text, justify="left", no_wrap=False, spans=spans)
 
 
 def _strip_rich_markup(text):
     """Strip Rich markup tags from a string, returning plain visual text."""
-    return re.sub(r'\[/?[^\]]*\]', '', text)
+    return _RICH_MARKUP_TAG.sub('', text)
 
 
 def _compute_subtitle_hitboxes(segments, width):
@@ -490,14 +656,83 @@ def _compute_subtitle_hitboxes(segments, width):
     return hitboxes
 
 
+# Maximum number of subtitle variants kept per reader
+SUBTITLE_CACHE_SIZE = 16
+
 def get_compact_subtitle(reader, width):
-    """Generate a compact subtitle based on terminal width."""
-    status_icon = ICONS.PLAYING if not reader.is_paused else ICONS.PAUSED
-    status_text = "PLAYING" if not reader.is_paused else "PAUSED"
-    
+    """Generate a compact subtitle based on terminal width, reusing it while its inputs are unchanged."""
     # Add speed indicator if not normal speed
     speed_indicator = reader._get_speed_display() if hasattr(reader, '_get_speed_display') else ""
     
+    key = (width, reader.is_paused, reader.auto_scroll_enabled, speed_indicator, _theme_version)
+    cached = reader._subtitle_cache.get(key)
+    if cached is None:
+        rich_result = _build_compact_subtitle(reader, width, speed_indicator)
+        if len(reader._subtitle_cache) >= SUBTITLE_CACHE_SIZE:
+            reader._subtitle_cache.clear()
+        cached = reader._subtitle_cache[key] = (rich_result, reader.subtitle_hitboxes)
+    
+    rich_result, reader.subtitle_hitboxes = cached
+    return rich_result
+
+# Subtitle markup templates with the theme colors and icons already resolved,
+# rebuilt lazily whenever a theme is applied
+_subtitle_templates = None
+_subtitle_templates_version = None
+
+def _get_subtitle_templates():
+    """Return the subtitle markup templates for the current theme."""
+    global _subtitle_templates, _subtitle_templates_version
+    if _subtitle_templates is not None and _subtitle_templates_version == _theme_version:
+        return _subtitle_templates
+    
+    keys = COLORS.CONTROL_KEYS
+    seps = COLORS.SEPARATORS
+    auto_text = f"[{keys}]{{auto_scroll_key}}{ICONS.SEPARATOR}{{top_visible_key}}[/{keys}]"
+    controls_text = (
+        f"[{keys}]{{prev_para_key}}{ICONS.SEPARATOR}{{prev_sent_key}}[/{keys}] "
+        f"[{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_UP}[/{COLORS.CONTROL_ICONS}] "
+        f"[{keys}]{{next_sent_key}}{ICONS.SEPARATOR}{{next_para_key}}[/{keys}] "
+        f"[{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_DOWN}[/{COLORS.CONTROL_ICONS}] "
+        f"[{seps}]{{separator}}[/{seps}] "
+        f"[{keys}]{{scroll_up_key}}{ICONS.SEPARATOR}{{scroll_down_key}}[/{keys}] "
+        f"[{COLORS.ARROW_ICONS}]{ICONS.ROW_NAVIGATION}[/{COLORS.ARROW_ICONS}] "
+        f"[{keys}]{{page_up_key}}{ICONS.SEPARATOR}{{page_down_key}}[/{keys}] "
+        f"[{COLORS.ARROW_ICONS}]{ICONS.PAGE_NAVIGATION}[/{COLORS.ARROW_ICONS}] "
+        f"[{seps}]{{separator}}[/{seps}] "
+        f"[{keys}]{{quit_key}}[/{keys}] [{COLORS.QUIT_ICON}]{ICONS.QUIT}[/{COLORS.QUIT_ICON}]"
+    )
+    
+    _subtitle_templates = {
+        # Wide layout: labelled status and auto-scroll mode
+        "wide": (
+            "[{playing_color}]{status_part}[/{playing_color}] "
+            f"[{seps}]{{status_sep}}[/{seps}] "
+            f"{auto_text} "
+            "[{auto_color}]{auto_part}[/{auto_color}] "
+            f"[{seps}]{{auto_sep}}[/{seps}] "
+            f"{controls_text}"
+        ),
+        # Narrow layouts: icons only, the separator length depends on the width
+        "narrow": (
+            "[{playing_color}]{status_part}[/{playing_color}] "
+            f"[{seps}]{{separator}}[/{seps}] "
+            f"{auto_text} "
+            "[{auto_color}]{auto_part}[/{auto_color}] "
+            f"[{seps}]{{separator}}[/{seps}] "
+            f"{controls_text}"
+        ),
+        "status": f"[{keys}]{{pause_key}}[/{keys}] {{status}}",
+    }
+    _subtitle_templates_version = _theme_version
+    return _subtitle_templates
+
+def _build_compact_subtitle(reader, width, speed_indicator):
+    """Build the subtitle markup and its click hitboxes for the given state."""
+    templates = _get_subtitle_templates()
+    status_icon = ICONS.PLAYING if not reader.is_paused else ICONS.PAUSED
+    status_text = "PLAYING" if not reader.is_paused else "PAUSED"
+    
     # Get keyboard shortcuts
     keyboard_shortcuts = get_keyboard_shortcuts()
     nav_shortcuts = keyboard_shortcuts.get("navigation", {})
@@ -505,27 +740,21 @@ def get_compact_subtitle(reader, width):
     display_shortcuts = keyboard_shortcuts.get("display_controls", {})
     app_shortcuts = keyboard_shortcuts.get("application", {})
     
-    # Control text with centralized colors using loaded shortcuts
     # Apply formatting to make control characters readable
-    prev_para_key = format_key_for_display(nav_shortcuts.get("prev_paragraph", "h"))
-    next_para_key = format_key_for_display(nav_shortcuts.get("next_paragraph", "l"))
-    prev_sent_key = format_key_for_display(nav_shortcuts.get("prev_sentence", "j"))
-    next_sent_key = format_key_for_display(nav_shortcuts.get("next_sentence", "k"))
-    scroll_up_key = format_key_for_display(nav_shortcuts.get("scroll_up", "u"))
-    scroll_down_key = format_key_for_display(nav_shortcuts.get("scroll_down", "n"))
-    page_up_key = format_key_for_display(nav_shortcuts.get("scroll_page_up", "i"))
-    page_down_key = format_key_for_display(nav_shortcuts.get("scroll_page_down", "m"))
-    quit_key = format_key_for_display(app_shortcuts.get("quit", "q"))
-    auto_scroll_key = format_key_for_display(display_shortcuts.get("toggle_auto_scroll", "a"))
-    top_visible_key = format_key_for_display(nav_shortcuts.get("move_to_top_visible", "t"))
-    
-    nav_text_1 = f"[{COLORS.CONTROL_KEYS}]{prev_para_key}{ICONS.SEPARATOR}{prev_sent_key}[/{COLORS.CONTROL_KEYS}]"
-    nav_text_2 = f"[{COLORS.CONTROL_KEYS}]{next_sent_key}{ICONS.SEPARATOR}{next_para_key}[/{COLORS.CONTROL_KEYS}]"
-    page_text = f"[{COLORS.CONTROL_KEYS}]{scroll_up_key}{ICONS.SEPARATOR}{scroll_down_key}[/{COLORS.CONTROL_KEYS}]"
-    scroll_text = f"[{COLORS.CONTROL_KEYS}]{page_up_key}{ICONS.SEPARATOR}{page_down_key}[/{COLORS.CONTROL_KEYS}]"
-    quit_text = f"[{COLORS.CONTROL_KEYS}]{quit_key}[/{COLORS.CONTROL_KEYS}]"
-    auto_text = f"[{COLORS.CONTROL_KEYS}]{auto_scroll_key}{ICONS.SEPARATOR}{top_visible_key}[/{COLORS.CONTROL_KEYS}]"
-    # Removed ui_mode_text from here as we don't want to show it visually
+    keys = {
+        "pause_key": format_key_for_display(tts_shortcuts.get("play_pause", "p")),
+        "prev_para_key": format_key_for_display(nav_shortcuts.get("prev_paragraph", "h")),
+        "next_para_key": format_key_for_display(nav_shortcuts.get("next_paragraph", "l")),
+        "prev_sent_key": format_key_for_display(nav_shortcuts.get("prev_sentence", "j")),
+        "next_sent_key": format_key_for_display(nav_shortcuts.get("next_sentence", "k")),
+        "scroll_up_key": format_key_for_display(nav_shortcuts.get("scroll_up", "u")),
+        "scroll_down_key": format_key_for_display(nav_shortcuts.get("scroll_down", "n")),
+        "page_up_key": format_key_for_display(nav_shortcuts.get("scroll_page_up", "i")),
+        "page_down_key": format_key_for_display(nav_shortcuts.get("scroll_page_down", "m")),
+        "quit_key": format_key_for_display(app_shortcuts.get("quit", "q")),
+        "auto_scroll_key": format_key_for_display(display_shortcuts.get("toggle_auto_scroll", "a")),
+        "top_visible_key": format_key_for_display(nav_shortcuts.get("move_to_top_visible", "t")),
+    }
     
     if reader.auto_scroll_enabled:
         auto_scroll_icon = ICONS.AUTO_SCROLL
@@ -534,212 +763,83 @@ def get_compact_subtitle(reader, width):
         auto_scroll_icon = ICONS.MANUAL_MODE
         auto_scroll_text = "MANUAL"
     
+    playing_color = COLORS.PLAYING_STATUS if not reader.is_paused else COLORS.PAUSED_STATUS
+    auto_color = COLORS.AUTO_SCROLL_ENABLED if reader.auto_scroll_enabled else COLORS.AUTO_SCROLL_DISABLED
+    
     if width >= 80:
-        base_sep = ICONS.LINE_SEPARATOR_LONG
+        separator = ICONS.LINE_SEPARATOR_LONG
         
         # Construct status part with proper spacing
-        pause_key = format_key_for_display(tts_shortcuts.get("play_pause", "p"))
         if speed_indicator:
-            status_part = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon} {speed_indicator} {status_text}"
+            status_part = templates["status"].format(pause_key=keys["pause_key"], status=f"{status_icon} {speed_indicator} {status_text}")
         else:
-            status_part = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon} {status_text}"
+            status_part = templates["status"].format(pause_key=keys["pause_key"], status=f"{status_icon} {status_text}")
             
         status_extra = 1 if status_text == "PAUSED" else 0
-        status_sep = base_sep + (ICONS.LINE_SEPARATOR_SHORT * status_extra)
+        status_sep = separator + (ICONS.LINE_SEPARATOR_SHORT * status_extra)
         
         auto_part = f"{auto_scroll_icon} {auto_scroll_text}"
         auto_extra = 2 if auto_scroll_text == "AUTO" else 0
-        auto_sep = base_sep + (ICONS.LINE_SEPARATOR_SHORT * auto_extra)
-        
-        # Get UI mode display
-        ui_mode_names = ["MIN", "MED", "FULL", "SR"]
-        ui_mode_display = ui_mode_names[config.UI_MODE]
-        
-        # Modified controls_text to remove ui_mode_text visual display but keep functionality
-        controls_text = f"{nav_text_1} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_UP}[/{COLORS.CONTROL_ICONS}] {nav_text_2} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_DOWN}[/{COLORS.CONTROL_ICONS}] [{COLORS.SEPARATORS}]{base_sep}[/{COLORS.SEPARATORS}] {page_text} [{COLORS.ARROW_ICONS}]{ICONS.ROW_NAVIGATION}[/{COLORS.ARROW_ICONS}] {scroll_text} [{COLORS.ARROW_ICONS}]{ICONS.PAGE_NAVIGATION}[/{COLORS.ARROW_ICONS}] [{COLORS.SEPARATORS}]{base_sep}[/{COLORS.SEPARATORS}] {quit_text} [{COLORS.QUIT_ICON}]{ICONS.QUIT}[/{COLORS.QUIT_ICON}]"
-        
-        playing_color = COLORS.PLAYING_STATUS if not reader.is_paused else COLORS.PAUSED_STATUS
-        auto_color = COLORS.AUTO_SCROLL_ENABLED if reader.auto_scroll_enabled else COLORS.AUTO_SCROLL_DISABLED
+        auto_sep = separator + (ICONS.LINE_SEPARATOR_SHORT * auto_extra)
         
-        rich_result = (
-            f"[{playing_color}]{status_part}[/{playing_color}] "
-            f"[{COLORS.SEPARATORS}]{status_sep}[/{COLORS.SEPARATORS}] "
-            f"{auto_text} "
-            f"[{auto_color}]{auto_part}[/{auto_color}] "
-            f"[{COLORS.SEPARATORS}]{auto_sep}[/{COLORS.SEPARATORS}] "
-            f"{controls_text}"
+        rich_result = templates["wide"].format(
+            playing_color=playing_color, status_part=status_part, status_sep=status_sep,
+            auto_color=auto_color, auto_part=auto_part, auto_sep=auto_sep,
+            separator=separator, **keys
         )
-
-        p_status = _strip_rich_markup(status_part)
-        p_status_sep = f" {status_sep} "
-        p_auto_part = auto_part + " "
-        p_auto_sep = f"{auto_sep} "
-
-        segments = [
-            ('pause',                p_status),
-            (None,                   p_status_sep),
-            ('toggle_auto_scroll',   auto_scroll_key),
-            (None,                   ICONS.SEPARATOR),
-            ('move_to_top_visible',  top_visible_key + " "),
-            ('toggle_auto_scroll',   p_auto_part),
-            (None,                   p_auto_sep),
-            ('prev_paragraph',       f"{prev_para_key}{ICONS.SEPARATOR}"),
-            ('prev_sentence',        f"{prev_sent_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_UP} "),
-            ('next_sentence',        f"{next_sent_key}{ICONS.SEPARATOR}"),
-            ('next_paragraph',       f"{next_para_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_DOWN} {base_sep} "),
-            ('scroll_up',            f"{scroll_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_down',          f"{scroll_down_key}"),
-            (None,                   f" {ICONS.ROW_NAVIGATION} "),
-            ('scroll_page_up',       f"{page_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_page_down',     f"{page_down_key}"),
-            (None,                   f" {ICONS.PAGE_NAVIGATION} {base_sep} "),
-            ('quit',                 f"{quit_key} {ICONS.QUIT}"),
-        ]
-        reader.subtitle_hitboxes = _compute_subtitle_hitboxes(segments, width)
-        return rich_result
-    elif width >= 70:
-        separator = ICONS.LINE_SEPARATOR_LONG
-        
-        # Construct status part with proper spacing
-        pause_key = format_key_for_display(tts_shortcuts.get("play_pause", "p"))
-        if speed_indicator:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}{speed_indicator}"
-        else:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}"
-            
-        icon_auto = f"{auto_scroll_icon}"
-        
-        # Get UI mode display
-        ui_mode_names = ["MIN", "MED", "FULL", "SR"]
-        ui_mode_display = ui_mode_names[config.UI_MODE]
-        
-        # Modified controls_text to remove ui_mode_text visual display but keep functionality
-        controls_text = f"[{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {nav_text_1} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_UP}[/{COLORS.CONTROL_ICONS}] {nav_text_2} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_DOWN}[/{COLORS.CONTROL_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {page_text} [{COLORS.ARROW_ICONS}]{ICONS.ROW_NAVIGATION}[/{COLORS.ARROW_ICONS}] {scroll_text} [{COLORS.ARROW_ICONS}]{ICONS.PAGE_NAVIGATION}[/{COLORS.ARROW_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {quit_text} [{COLORS.QUIT_ICON}]{ICONS.QUIT}[/{COLORS.QUIT_ICON}]"
-        
-        playing_color = COLORS.PLAYING_STATUS if not reader.is_paused else COLORS.PAUSED_STATUS
-        auto_color = COLORS.AUTO_SCROLL_ENABLED if reader.auto_scroll_enabled else COLORS.AUTO_SCROLL_DISABLED
-        
-        rich_result = f"[{playing_color}]{icon_status}[/{playing_color}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {auto_text} [{auto_color}]{icon_auto}[/{auto_color}] {controls_text}"
-        segments = [
-            ('pause',                _strip_rich_markup(icon_status)),
-            (None,                   f" {separator} "),
-            ('toggle_auto_scroll',   auto_scroll_key),
-            (None,                   ICONS.SEPARATOR),
-            ('move_to_top_visible',  top_visible_key + " "),
-            ('toggle_auto_scroll',   icon_auto),
-            (None,                   f" {separator} "),
-            ('prev_paragraph',       f"{prev_para_key}{ICONS.SEPARATOR}"),
-            ('prev_sentence',        f"{prev_sent_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_UP} "),
-            ('next_sentence',        f"{next_sent_key}{ICONS.SEPARATOR}"),
-            ('next_paragraph',       f"{next_para_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_DOWN} {separator} "),
-            ('scroll_up',            f"{scroll_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_down',          f"{scroll_down_key}"),
-            (None,                   f" {ICONS.ROW_NAVIGATION} "),
-            ('scroll_page_up',       f"{page_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_page_down',     f"{page_down_key}"),
-            (None,                   f" {ICONS.PAGE_NAVIGATION} {separator} "),
-            ('quit',                 f"{quit_key} {ICONS.QUIT}"),
-        ]
-        reader.subtitle_hitboxes = _compute_subtitle_hitboxes(segments, width)
-        return rich_result
-    elif width >= 65:
-        separator = ICONS.LINE_SEPARATOR_MEDIUM
-        
-        # Construct status part with proper spacing
-        pause_key = format_key_for_display(tts_shortcuts.get("play_pause", "p"))
-        if speed_indicator:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}{speed_indicator}"
-        else:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}"
-            
-        icon_auto = f"{auto_scroll_icon}"
-        
-        # Get UI mode display
-        ui_mode_names = ["MIN", "MED", "FULL", "SR"]
-        ui_mode_display = ui_mode_names[config.UI_MODE]
-        
-        # Modified controls_text to remove ui_mode_text visual display but keep functionality
-        controls_text = f"[{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {nav_text_1} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_UP}[/{COLORS.CONTROL_ICONS}] {nav_text_2} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_DOWN}[/{COLORS.CONTROL_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {page_text} [{COLORS.ARROW_ICONS}]{ICONS.ROW_NAVIGATION}[/{COLORS.ARROW_ICONS}] {scroll_text} [{COLORS.ARROW_ICONS}]{ICONS.PAGE_NAVIGATION}[/{COLORS.ARROW_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {quit_text} [{COLORS.QUIT_ICON}]{ICONS.QUIT}[/{COLORS.QUIT_ICON}]"
-        
-        playing_color = COLORS.PLAYING_STATUS if not reader.is_paused else COLORS.PAUSED_STATUS
-        auto_color = COLORS.AUTO_SCROLL_ENABLED if reader.auto_scroll_enabled else COLORS.AUTO_SCROLL_DISABLED
-        
-        rich_result = f"[{playing_color}]{icon_status}[/{playing_color}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {auto_text} [{auto_color}]{icon_auto}[/{auto_color}] {controls_text}"
-        segments = [
-            ('pause',                _strip_rich_markup(icon_status)),
-            (None,                   f" {separator} "),
-            ('toggle_auto_scroll',   auto_scroll_key),
+        status_segments = [
+            ('pause',                _strip_rich_markup(status_part)),
+            (None,                   f" {status_sep} "),
+            ('toggle_auto_scroll',   keys["auto_scroll_key"]),
             (None,                   ICONS.SEPARATOR),
-            ('move_to_top_visible',  top_visible_key + " "),
-            ('toggle_auto_scroll',   icon_auto),
-            (None,                   f" {separator} "),
-            ('prev_paragraph',       f"{prev_para_key}{ICONS.SEPARATOR}"),
-            ('prev_sentence',        f"{prev_sent_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_UP} "),
-            ('next_sentence',        f"{next_sent_key}{ICONS.SEPARATOR}"),
-            ('next_paragraph',       f"{next_para_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_DOWN} {separator} "),
-            ('scroll_up',            f"{scroll_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_down',          f"{scroll_down_key}"),
-            (None,                   f" {ICONS.ROW_NAVIGATION} "),
-            ('scroll_page_up',       f"{page_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_page_down',     f"{page_down_key}"),
-            (None,                   f" {ICONS.PAGE_NAVIGATION} {separator} "),
-            ('quit',                 f"{quit_key} {ICONS.QUIT}"),
+            ('move_to_top_visible',  keys["top_visible_key"] + " "),
+            ('toggle_auto_scroll',   auto_part + " "),
+            (None,                   f"{auto_sep} "),
         ]
-        reader.subtitle_hitboxes = _compute_subtitle_hitboxes(segments, width)
-        return rich_result
     else:
-        separator = ICONS.LINE_SEPARATOR_SHORT
-        
-        # Construct status part with proper spacing
-        pause_key = format_key_for_display(tts_shortcuts.get("play_pause", "p"))
-        if speed_indicator:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}{speed_indicator}"
+        if width >= 70:
+            separator = ICONS.LINE_SEPARATOR_LONG
+        elif width >= 65:
+            separator = ICONS.LINE_SEPARATOR_MEDIUM
         else:
-            icon_status = f"[{COLORS.CONTROL_KEYS}]{pause_key}[/{COLORS.CONTROL_KEYS}] {status_icon}"
-            
-        icon_auto = f"{auto_scroll_icon}"
+            separator = ICONS.LINE_SEPARATOR_SHORT
         
-        # Get UI mode display
-        ui_mode_names = ["MIN", "MED", "FULL", "SR"]
-        ui_mode_display = ui_mode_names[config.UI_MODE]
-        
-        # Modified controls_text to remove ui_mode_text visual display but keep functionality
-        controls_text = f"[{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {nav_text_1} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_UP}[/{COLORS.CONTROL_ICONS}] {nav_text_2} [{COLORS.CONTROL_ICONS}]{ICONS.HIGHLIGHT_DOWN}[/{COLORS.CONTROL_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {page_text} [{COLORS.ARROW_ICONS}]{ICONS.ROW_NAVIGATION}[/{COLORS.ARROW_ICONS}] {scroll_text} [{COLORS.ARROW_ICONS}]{ICONS.PAGE_NAVIGATION}[/{COLORS.ARROW_ICONS}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {quit_text} [{COLORS.QUIT_ICON}]{ICONS.QUIT}[/{COLORS.QUIT_ICON}]"
-        
-        playing_color = COLORS.PLAYING_STATUS if not reader.is_paused else COLORS.PAUSED_STATUS
-        auto_color = COLORS.AUTO_SCROLL_ENABLED if reader.auto_scroll_enabled else COLORS.AUTO_SCROLL_DISABLED
+        # Construct status part with proper spacing
+        status_part = templates["status"].format(pause_key=keys["pause_key"], status=f"{status_icon}{speed_indicator}")
+        auto_part = f"{auto_scroll_icon}"
         
-        rich_result = f"[{playing_color}]{icon_status}[/{playing_color}] [{COLORS.SEPARATORS}]{separator}[/{COLORS.SEPARATORS}] {auto_text} [{auto_color}]{icon_auto}[/{auto_color}] {controls_text}"
-        segments = [
-            ('pause',                _strip_rich_markup(icon_status)),
+        rich_result = templates["narrow"].format(
+            playing_color=playing_color, status_part=status_part,
+            auto_color=auto_color, auto_part=auto_part,
+            separator=separator, **keys
+        )
+        status_segments = [
+            ('pause',                _strip_rich_markup(status_part)),
             (None,                   f" {separator} "),
-            ('toggle_auto_scroll',   auto_scroll_key),
+            ('toggle_auto_scroll',   keys["auto_scroll_key"]),
             (None,                   ICONS.SEPARATOR),
-            ('move_to_top_visible',  top_visible_key + " "),
-            ('toggle_auto_scroll',   icon_auto),
+            ('move_to_top_visible',  keys["top_visible_key"] + " "),
+            ('toggle_auto_scroll',   auto_part),
             (None,                   f" {separator} "),
-            ('prev_paragraph',       f"{prev_para_key}{ICONS.SEPARATOR}"),
-            ('prev_sentence',        f"{prev_sent_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_UP} "),
-            ('next_sentence',        f"{next_sent_key}{ICONS.SEPARATOR}"),
-            ('next_paragraph',       f"{next_para_key}"),
-            (None,                   f" {ICONS.HIGHLIGHT_DOWN} {separator} "),
-            ('scroll_up',            f"{scroll_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_down',          f"{scroll_down_key}"),
-            (None,                   f" {ICONS.ROW_NAVIGATION} "),
-            ('scroll_page_up',       f"{page_up_key}{ICONS.SEPARATOR}"),
-            ('scroll_page_down',     f"{page_down_key}"),
-            (None,                   f" {ICONS.PAGE_NAVIGATION} {separator} "),
-            ('quit',                 f"{quit_key} {ICONS.QUIT}"),
         ]
-        reader.subtitle_hitboxes = _compute_subtitle_hitboxes(segments, width)
-        return rich_result
+    
+    segments = status_segments + [
+        ('prev_paragraph',       f"{keys['prev_para_key']}{ICONS.SEPARATOR}"),
+        ('prev_sentence',        f"{keys['prev_sent_key']}"),
+        (None,                   f" {ICONS.HIGHLIGHT_UP} "),
+        ('next_sentence',        f"{keys['next_sent_key']}{ICONS.SEPARATOR}"),
+        ('next_paragraph',       f"{keys['next_para_key']}"),
+        (None,                   f" {ICONS.HIGHLIGHT_DOWN} {separator} "),
+        ('scroll_up',            f"{keys['scroll_up_key']}{ICONS.SEPARATOR}"),
+        ('scroll_down',          f"{keys['scroll_down_key']}"),
+        (None,                   f" {ICONS.ROW_NAVIGATION} "),
+        ('scroll_page_up',       f"{keys['page_up_key']}{ICONS.SEPARATOR}"),
+        ('scroll_page_down',     f"{keys['page_down_key']}"),
+        (None,                   f" {ICONS.PAGE_NAVIGATION} {separator} "),
+        ('quit',                 f"{keys['quit_key']} {ICONS.QUIT}"),
+    ]
+    reader.subtitle_hitboxes = _compute_subtitle_hitboxes(segments, width)
+    return rich_result
 
 def render_recent_books_overlay(reader, width, height):
     """Render the recent books overlay."""
@@ -843,6 +943,103 @@ def render_chapter_index_overlay(reader, width, height):
 
     return panel, min(60, width - 4), panel_height
 
+# Rendered book panel borders, keyed by terminal size, title, subtitle and theme
+PANEL_CACHE_SIZE = 16
+_PANEL_CACHE = {}
+
+def _get_panel_frame(width, height, title, subtitle):
+    """
+    Get the rendered border rows of the book panel.
+    
+    Returns:
+        Tuple of (title width, frames), where frames maps a panel width to its
+        (top row, blank row, left edge, right edge, bottom row) strings
+    """
+    key = (width, height, title, subtitle, COLORS.PANEL_BORDER, _theme_version)
+    entry = _PANEL_CACHE.get(key)
+    if entry is None:
+        if len(_PANEL_CACHE) >= PANEL_CACHE_SIZE:
+            _PANEL_CACHE.clear()
+        entry = _PANEL_CACHE[key] = (Text.from_markup(title).cell_len, {})
+    return entry
+
+
+def _render_book_panel(console, visible_lines, width, height, title, subtitle):
+    """
+    Render the book text inside the bordered panel used by UI modes 1 and 2.
+    
+    The output matches a Panel with (1, 4) padding, but the border rows are only
+    rendered by Rich when the title, subtitle, size or theme changes.
+    """
+    title_width, frames = _get_panel_frame(width, height, title, subtitle)
+    
+    # Like a non-expanding Panel, shrink to the widest line or the title
+    content_width = max((line.cell_len for line in visible_lines), default=0) + 8
+    inner_width = min(width - 2, max(content_width, title_width + 2))
+    text_width = inner_width - 8
+    
+    if height < 5 or text_width < 1 or content_width > inner_width or len(visible_lines) > height - 4:
+        # Lines that don't fit are re-wrapped by the Panel, so let it lay them out
+        book_panel = Panel(
+            Text("\n").join(visible_lines),
+            title=title,
+            subtitle=subtitle,
+            border_style=COLORS.PANEL_BORDER,
+            padding=(1, 4),
+            title_align="center",
+            subtitle_align="center",
+            width=width,
+            height=height,
+            expand=False
+        )
+        with console.capture() as capture:
+            console.print(book_panel, end='', overflow='crop')
+        return '\n'.join(capture.get().split('\n')[:height])
+    
+    frame = frames.get(inner_width)
+    if frame is None:
+        frame_panel = Panel(
+            Text(""),
+            title=title,
+            subtitle=subtitle,
+            border_style=COLORS.PANEL_BORDER,
+            padding=0,
+            title_align="center",
+            subtitle_align="center",
+            width=inner_width + 2,
+            height=3,
+            expand=True
+        )
+        with console.capture() as capture:
+            console.print(frame_panel, end='', overflow='crop')
+        top, blank, bottom = capture.get().split('\n')[:3]
+        left_edge, _, right_edge = blank.partition(" " * inner_width)
+        frame = frames[inner_width] = (top, blank, left_edge, right_edge, bottom)
+    top, blank, left_edge, right_edge, bottom = frame
+    
+    padded_content = Text()
+    for i, line in enumerate(visible_lines):
+        padded_content.append(line)
+        padded_content.append(" " * (text_width - line.cell_len))
+        if i < len(visible_lines) - 1:
+            padded_content.append("\n")
+    
+    text_rows = []
+    if visible_lines:
+        with console.capture() as capture:
+            console.print(padded_content, width=text_width, end='', overflow='crop')
+        text_rows = capture.get().split('\n')
+    
+    left = left_edge + "    "
+    right = "    " + right_edge
+    rows = [top, blank]
+    rows.extend(left + row + right for row in text_rows)
+    rows.extend(blank for _ in range(height - 4 - len(text_rows)))
+    rows.append(blank)
+    rows.append(bottom)
+    return '\n'.join(rows)
+
+
 async def display_ui(reader):
     """Display the UI."""
     if reader.render_lock.locked():
@@ -874,17 +1071,21 @@ async def display_ui(reader):
             reader.last_rendered_state = current_state
             reader.last_terminal_size = (width, height)
             
-            # Start building the full output buffer
+            # Start building the full output buffer as a list of parts joined once at the end
             # Move cursor to top-left and hide cursor
             # We avoid clearing the whole screen (\033[2J) to prevent flickering
-            full_output = '\033[?25l\033[H'
+            frame_parts = ['\033[?25l\033[H']
             
-            temp_console = Console(width=width, height=height, force_terminal=True)
+            # Reuse the reader's render console, only resizing it when the terminal changed
+            render_console = reader._render_console
+            if reader._render_console_size != (width, height):
+                render_console.size = (width, height)
+                reader._render_console_size = (width, height)
             
             book_output = ""
             
             if getattr(reader, 'speed_reading_enabled', False):
-                book_output = render_speed_reading_output(reader, width, height, temp_console)
+                book_output = render_speed_reading_output(reader, width, height, render_console)
             else:
                 visible_lines = get_visible_content(reader)
 
@@ -908,19 +1109,12 @@ async def display_ui(reader):
                     if i < height - 1:
                         padded_content.append("\n")
                 
-                with temp_console.capture() as capture:
-                    temp_console.print(padded_content, end='', overflow='crop')
+                with render_console.capture() as capture:
+                    render_console.print(padded_content, end='', overflow='crop')
                 
                 book_output = capture.get()
                 
             elif config.UI_MODE == 1:
-                # Build book_content for Mode 1 and 2
-                book_content = Text("")
-                for i, line in enumerate(visible_lines):
-                    book_content.append(line)
-                    if i < len(visible_lines) - 1:
-                        book_content.append("\n")
-
                 # Mode 1: Medium - top bar with title and progress, borders, no bottom controls
                 progress_bar_width = 10
                 filled_blocks = int((progress_percent / 100) * progress_bar_width)
@@ -942,38 +1136,13 @@ async def display_ui(reader):
                 
                 progress_text = f"{title_text} {connecting_line} {percentage_text}"
                 
-                # Create a solid border line for the bottom
-                # Using a simple approach that matches mode 2 behavior
-                book_panel = Panel(
-                    book_content,
-                    title=f"[{COLORS.PANEL_TITLE}]{progress_text}[/{COLORS.PANEL_TITLE}]",
-                    subtitle="",  # Empty subtitle to avoid border issues
-                    border_style=COLORS.PANEL_BORDER,
-                    padding=(1, 4),  # Same padding as mode 2 for consistency
-                    title_align="center",
-                    subtitle_align="center",
-                    width=width,
-                    height=height,
-                    expand=False
+                book_output = _render_book_panel(
+                    render_console, visible_lines, width, height,
+                    f"[{COLORS.PANEL_TITLE}]{progress_text}[/{COLORS.PANEL_TITLE}]",
+                    ""  # Empty subtitle to avoid border issues
                 )
                 
-                with temp_console.capture() as capture:
-                    temp_console.print(book_panel, end='', overflow='crop')
-                
-                book_output = capture.get()
-                output_lines = book_output.split('\n')
-                if len(output_lines) > height:
-                    output_lines = output_lines[:height]
-                    book_output = '\n'.join(output_lines)
-                
             else:
-                # Build book_content for Mode 1 and 2
-                book_content = Text("")
-                for i, line in enumerate(visible_lines):
-                    book_content.append(line)
-                    if i < len(visible_lines) - 1:
-                        book_content.append("\n")
-
                 # Mode 2: Full - default mode with all UI elements
                 progress_bar_width = 10
                 filled_blocks = int((progress_percent / 100) * progress_bar_width)
@@ -997,36 +1166,31 @@ async def display_ui(reader):
                 
                 subtitle = get_compact_subtitle(reader, width)
                 
-                book_panel = Panel(
-                    book_content,
-                    title=f"[{COLORS.PANEL_TITLE}]{progress_text}[/{COLORS.PANEL_TITLE}]",
-                    subtitle=subtitle,
-                    border_style=COLORS.PANEL_BORDER,
-                    padding=(1, 4),
-                    title_align="center",
-                    subtitle_align="center",
-                    width=width,
-                    height=height,
-                    expand=False
+                book_output = _render_book_panel(
+                    render_console, visible_lines, width, height,
+                    f"[{COLORS.PANEL_TITLE}]{progress_text}[/{COLORS.PANEL_TITLE}]",
+                    subtitle
                 )
-                
-                with temp_console.capture() as capture:
-                    temp_console.print(book_panel, end='', overflow='crop')
-                
-                book_output = capture.get()
-                output_lines = book_output.split('\n')
-                if len(output_lines) > height:
-                    output_lines = output_lines[:height]
-                    book_output = '\n'.join(output_lines)
             
-            # Append book content to full output
-            full_output += book_output
+            # Append book content to full output. Only rows that changed since the last frame
+            # are rewritten; a resize, theme change or closed overlay forces a full repaint.
+            output_lines = book_output.split('\n')
+            output_key = (width, height, _theme_version)
+            if reader._last_output_lines is None or reader._last_output_key != output_key:
+                frame_parts.append(book_output)
+            else:
+                previous_lines = reader._last_output_lines
+                for row, line in enumerate(output_lines):
+                    if row >= len(previous_lines) or previous_lines[row] != line:
+                        frame_parts.append(f"\033[{row + 1};1H\033[2K{line}")
+            reader._last_output_lines = output_lines
+            reader._last_output_key = output_key
             
             # Overlay menu if needed
             if reader.show_recent_menu:
                 menu_panel, panel_width, panel_height = render_recent_books_overlay(reader, width, height)
-                with temp_console.capture() as capture:
-                    temp_console.print(menu_panel, end='', overflow='crop')
+                with render_console.capture() as capture:
+                    render_console.print(menu_panel, end='', overflow='crop')
                 menu_output = capture.get()
                 
                 # Split menu output into lines
@@ -1035,20 +1199,20 @@ async def display_ui(reader):
                 start_y = (height - panel_height) // 2
                 start_x = (width - panel_width) // 2
                 
-                # Construct overlay string using ANSI cursor movements
-                overlay = ""
+                # Construct overlay using ANSI cursor movements
                 for i, line in enumerate(menu_lines):
                     if i >= panel_height: break
                     # Move cursor to (start_y + i, start_x) - 1-based coordinates
-                    overlay += f"\033[{start_y + i + 1};{start_x + 1}H{line}"
+                    frame_parts.append(f"\033[{start_y + i + 1};{start_x + 1}H{line}")
                 
-                full_output += overlay
+                # The overlay hides book rows, so they must be repainted once it closes
+                reader._last_output_lines = None
 
             # Overlay chapter index if needed
             if reader.show_chapter_index:
                 chapter_panel, panel_width, panel_height = render_chapter_index_overlay(reader, width, height)
-                with temp_console.capture() as capture:
-                    temp_console.print(chapter_panel, end='', overflow='crop')
+                with render_console.capture() as capture:
+                    render_console.print(chapter_panel, end='', overflow='crop')
                 chapter_output = capture.get()
 
                 chapter_lines = chapter_output.split('\n')
@@ -1062,19 +1226,45 @@ async def display_ui(reader):
                 reader.chapter_index_panel_width = panel_width
                 reader.chapter_index_panel_height = panel_height
 
-                overlay = ""
                 for i, line in enumerate(chapter_lines):
                     if i >= panel_height: break
-                    overlay += f"\033[{start_y + i + 1};{start_x + 1}H{line}"
+                    frame_parts.append(f"\033[{start_y + i + 1};{start_x + 1}H{line}")
 
-                full_output += overlay
+                reader._last_output_lines = None
 
-            sys.stdout.write(full_output)
-            sys.stdout.flush()
+            _write_frame(''.join(frame_parts))
             
         except (IndexError, ValueError):
             pass
 
+# The stdout stream last checked by _write_frame and its tty file descriptor, if any
+_frame_stream = (None, None)
+
+def _write_frame(output):
+    """Write a rendered frame to the terminal with a single unbuffered write."""
+    global _frame_stream
+    stream = sys.stdout
+    if _frame_stream[0] is not stream:
+        try:
+            fd = stream.fileno()
+            fd = fd if os.isatty(fd) else None
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        _frame_stream = (stream, fd)
+    
+    fd = _frame_stream[1]
+    if fd is None:
+        # Not a terminal (redirected or captured output), keep using the text stream
+        stream.write(output)
+        stream.flush()
+        return
+    
+    # Anything still buffered in the text stream has to reach the terminal first
+    stream.flush()
+    data = memoryview(output.encode(stream.encoding or 'utf-8', errors='replace'))
+    while data:
+        data = data[os.write(fd, data):]
+
 def _get_highlightable_words(sentence: str) -> list[str]:
     """
     Get list of words that should be considered for highlighting.
@@ -1092,7 +1282,7 @@ def _get_highlightable_words(sentence: str) -> list[str]:
     tokens = sentence.lstrip().split()
     
     # Filter out tokens that contain only punctuation/non-alphanumeric characters
-    words = [token for token in tokens if re.search(r'[a-zA-Z0-9]', token)]
+    words = [token for token in tokens if _HIGHLIGHTABLE_CHAR.search(token)]
     
     return words
 
@@ -1106,7 +1296,7 @@ def _should_token_be_highlighted(token: str) -> bool:
     Returns:
         True if token should be highlighted, False otherwise
     """
-    return bool(re.search(r'[a-zA-Z0-9]', token))
+    return bool(_HIGHLIGHTABLE_CHAR.search(token))
 
 
 def _extract_core_word(token: str) -> str: